@@ -7,28 +7,126 @@ and generating tailored resume files through the existing pipeline.
 """
 
 import sys
-import asyncio
-import json
+import gzip
+import hashlib
+import importlib.util
+import io
+import logging
+import logging.handlers
 import os
+import queue
+import re
 import tempfile
 import zipfile
-import base64
+import atexit
 import shutil
-import subprocess
-from datetime import datetime
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 
-from flask import Flask, request, render_template_string, jsonify, send_file
+import orjson
+
+try:
+    import brotli  # optional: adds a br variant of the static page
+except ImportError:
+    brotli = None
+from flask import Flask, Response, request, send_file
+from flask.json.provider import JSONProvider
+
+import jd_cache
 
 # Import PDF utilities
-from pdf_utils import compile_latex_to_pdf, backup_resume_files, generate_comparison_pdfs, pdf_to_base64
+from pdf_utils import compile_latex_to_pdf, fast_copy
+
+# Non-string dict keys and numpy arrays/scalars (e.g. from the semantic JD
+# cache) serialize natively instead of needing a conversion pass first
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson, for request.get_json() and jsonify()"""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, option=ORJSON_OPTIONS).decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, option=ORJSON_OPTIONS), mimetype='application/json')
+
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+# Log records are queued by request threads and written by one listener
+# thread, so handlers never block on stdout
+logger = logging.getLogger('app')
+log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+# jd_cache logs through the same queue
+for queued_logger in (logger, jd_cache.logger):
+    queued_logger.setLevel(logging.INFO)
+    queued_logger.propagate = False
+    queued_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+log_handler = logging.StreamHandler(sys.stdout)
+log_handler.setFormatter(logging.Formatter('%(message)s'))
+log_listener = logging.handlers.QueueListener(log_queue, log_handler)
+log_listener.start()
+atexit.register(log_listener.stop)
+
+
+def json_response(data: Any, status: int = 200) -> Response:
+    """JSON response serialized with orjson (much faster than jsonify on large payloads)"""
+    return Response(orjson.dumps(data, option=ORJSON_OPTIONS), status=status, mimetype='application/json')
+
 
 # Import existing pipeline modules
 sys.path.append('.')
 
+
+def load_pipeline_module(name: str, filename: str):
+    """Import a pipeline script (hyphenated filename) as a module"""
+    spec = importlib.util.spec_from_file_location(name, Path(__file__).parent / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# Loaded once at startup so requests don't pay interpreter startup + imports
+jd_parser = load_pipeline_module('jd_parser', 'jd-parser.py')
+skills_updater = load_pipeline_module('skills_updater', 'skills-updater.py')
+summary_updater = load_pipeline_module('summary_updater', 'summary-updater.py')
+
+# Shared worker pool for pipeline stages (keeps the per-stage timeouts).
+# Workers mostly sit in LLM requests or pdflatex waits with the GIL released,
+# so size it by core count to let concurrent sessions' compiles overlap
+EXECUTOR = ThreadPoolExecutor(max_workers=max(4, os.cpu_count() or 1))
+
+# Small pool for filesystem housekeeping (e.g. deleting old baselines) kept
+# separate so it never waits behind a long-running pipeline stage
+IO_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
+
+def run_stage(func, timeout: int, **kwargs):
+    """Run a pipeline stage on the shared executor, waiting at most `timeout` seconds"""
+    future = EXECUTOR.submit(func, **kwargs)
+    try:
+        return future.result(timeout=timeout)
+    except FuturesTimeoutError:
+        # A started stage can't be cancelled and keeps writing into its
+        # session dir, so release_session_dir must not pool that dir
+        if kwargs.get('artifacts_dir'):
+            with session_dirs_lock:
+                overrunning_stages[str(Path(kwargs['artifacts_dir']).parent)] = future
+        raise
+
 # HTML Template for the web interface
 HTML_TEMPLATE = """
 <!DOCTYPE html>
@@ -340,10 +438,10 @@ HTML_TEMPLATE = """
                 <button type="submit" class="btn-primary" id="processBtn">
                     Process Job Description
                 </button>
-                <button type="button" class="btn-secondary" onclick="clearForm()">
+                <button type="button" class="btn-secondary" data-action="clear">
                     Clear
                 </button>
-                <button type="button" class="btn-secondary" onclick="resetBaseline()" title="Reset the baseline 'before' resume to current state">
+                <button type="button" class="btn-secondary" data-action="reset" title="Reset the baseline 'before' resume to current state">
                     Reset Baseline
                 </button>
             </div>
@@ -355,7 +453,7 @@ HTML_TEMPLATE = """
             <h3>🎯 Extracted Skills</h3>
             <div id="skillsContent"></div>
             <div class="button-group" style="margin-top: 20px;">
-                <button type="button" class="btn-success" id="updateResumeBtn" onclick="updateResume()">
+                <button type="button" class="btn-success" id="updateResumeBtn" data-action="update">
                     Update Resume with Skills
                 </button>
             </div>
@@ -371,11 +469,11 @@ HTML_TEMPLATE = """
             <div class="pdf-viewer">
                 <div class="pdf-container">
                     <h4>Before (Original)</h4>
-                    <embed id="beforePDF" class="pdf-embed" type="application/pdf">
+                    <iframe id="beforePDF" class="pdf-embed" title="Resume before tailoring"></iframe>
                 </div>
                 <div class="pdf-container">
                     <h4>After (Tailored)</h4>
-                    <embed id="afterPDF" class="pdf-embed" type="application/pdf">
+                    <iframe id="afterPDF" class="pdf-embed" title="Resume after tailoring"></iframe>
                 </div>
             </div>
         </div>
@@ -388,11 +486,26 @@ HTML_TEMPLATE = """
         const skillsSection = document.getElementById('skillsSection');
         const skillsContent = document.getElementById('skillsContent');
         const updateResumeBtn = document.getElementById('updateResumeBtn');
+        const jobDescriptionInput = document.getElementById('jobDescription');
+        const changesSummary = document.getElementById('changesSummary');
+        const changesContent = document.getElementById('changesContent');
+        const pdfComparison = document.getElementById('pdfComparison');
+        const beforePDF = document.getElementById('beforePDF');
+        const afterPDF = document.getElementById('afterPDF');
+
+        // One delegated listener for every data-action button
+        const actions = { clear: clearForm, update: updateResume, reset: resetBaseline };
+        document.addEventListener('click', (e) => {
+            const button = e.target.closest('[data-action]');
+            if (button && actions[button.dataset.action]) {
+                actions[button.dataset.action]();
+            }
+        });
 
         form.addEventListener('submit', async (e) => {
             e.preventDefault();
             
-            const jobDescription = document.getElementById('jobDescription').value.trim();
+            const jobDescription = jobDescriptionInput.value.trim();
             if (!jobDescription) {
                 showStatus('Please enter a job description.', 'error');
                 return;
@@ -404,7 +517,9 @@ HTML_TEMPLATE = """
             showStatus('Processing job description and extracting skills...', 'info');
 
             try {
-                const response = await fetch('/process-jd', {
+                // Streamed as Server-Sent Events so the skills render as soon
+                // as extraction finishes, without waiting on the baseline check
+                const response = await fetch('/process-jd-stream', {
                     method: 'POST',
                     headers: {
                         'Content-Type': 'application/json',
@@ -413,22 +528,16 @@ HTML_TEMPLATE = """
                 });
 
                 if (response.ok) {
-                    const result = await response.json();
-                    if (result.success) {
-                        showStatus(`✅ Success! Extracted ${result.skills_count} relevant skills.`, 'success');
-                        
-                        // Display extracted skills
-                        if (result.skills) {
-                            displaySkills(result.skills);
-                        }
-                        
-                        // Show PDF comparison if available
-                        if (result.before_pdf && result.after_pdf) {
-                            showPDFComparison(result.before_pdf, result.after_pdf);
-                        }
-                    } else {
-                        showStatus(`❌ Error: ${result.error}`, 'error');
-                    }
+                    await readEvents(response, {
+                        progress: data => showStatus(data.message, 'info'),
+                        skills: data => {
+                            showStatus(`✅ Success! Extracted ${data.skills_count} relevant skills.`, 'success');
+                            if (data.skills) {
+                                displaySkills(data.skills);
+                            }
+                        },
+                        error: data => showStatus(`❌ Error: ${data.error}`, 'error'),
+                    });
                 } else {
                     const error = await response.json();
                     showStatus(`❌ Error: ${error.error || 'Processing failed'}`, 'error');
@@ -442,6 +551,29 @@ HTML_TEMPLATE = """
             }
         });
 
+        async function readEvents(response, handlers) {
+            // Parse a text/event-stream body; frames end with a blank line
+            const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+            let buffer = '';
+            while (true) {
+                const { value, done } = await reader.read();
+                if (done) break;
+                buffer += value;
+                let end;
+                while ((end = buffer.indexOf('\\n\\n')) !== -1) {
+                    const frame = buffer.slice(0, end);
+                    buffer = buffer.slice(end + 2);
+                    let event = 'message';
+                    let data = '';
+                    for (const line of frame.split('\\n')) {
+                        if (line.startsWith('event: ')) event = line.slice(7);
+                        else if (line.startsWith('data: ')) data += line.slice(6);
+                    }
+                    if (handlers[event]) handlers[event](JSON.parse(data));
+                }
+            }
+        }
+
         function showStatus(message, type) {
             status.innerHTML = message;
             status.className = `status ${type}`;
@@ -449,65 +581,51 @@ HTML_TEMPLATE = """
         }
 
         function clearForm() {
-            document.getElementById('jobDescription').value = '';
+            jobDescriptionInput.value = '';
             status.style.display = 'none';
             skillsSection.style.display = 'none';
-            document.getElementById('pdfComparison').style.display = 'none';
-            document.getElementById('changesSummary').style.display = 'none';
+            pdfComparison.style.display = 'none';
+            changesSummary.style.display = 'none';
+        }
+
+        function el(tag, className, text) {
+            // Build an element; text goes in via textContent, never parsed as HTML
+            const node = document.createElement(tag);
+            if (className) node.className = className;
+            if (text !== undefined) node.textContent = text;
+            return node;
+        }
+
+        function skillsGrid(skillList) {
+            const grid = el('div', 'skills-grid');
+            for (const skill of skillList) {
+                grid.appendChild(el('div', 'skill-item', skill));
+            }
+            return grid;
         }
 
         function displaySkills(skills) {
-            let html = '';
-            
+            const frag = document.createDocumentFragment();
+
             // Group skills by category if available
-            if (skills.by_section_top3) {
-                for (const [category, skillList] of Object.entries(skills.by_section_top3)) {
-                    if (skillList && skillList.length > 0) {
-                        html += `<div class="skill-category">
-                            <h4>${category}</h4>
-                            <div class="skills-grid">`;
-                        skillList.forEach(skill => {
-                            html += `<div class="skill-item">${skill}</div>`;
-                        });
-                        html += `</div></div>`;
-                    }
-                }
-            } else if (skills.categorized) {
-                for (const [category, skillList] of Object.entries(skills.categorized)) {
+            const categories = skills.by_section_top3 || skills.categorized;
+            if (categories) {
+                for (const [category, skillList] of Object.entries(categories)) {
                     if (skillList && skillList.length > 0) {
-                        html += `<div class="skill-category">
-                            <h4>${category}</h4>
-                            <div class="skills-grid">`;
-                        skillList.forEach(skill => {
-                            html += `<div class="skill-item">${skill}</div>`;
-                        });
-                        html += `</div></div>`;
+                        const section = el('div', 'skill-category');
+                        section.append(el('h4', '', category), skillsGrid(skillList));
+                        frag.appendChild(section);
                     }
                 }
-            } else if (skills.skills_flat) {
-                // Display as flat list
-                html += `<div class="skills-grid">`;
-                skills.skills_flat.forEach(skill => {
-                    html += `<div class="skill-item">${skill}</div>`;
-                });
-                html += `</div>`;
-            } else if (skills.flat) {
+            } else {
                 // Display as flat list
-                html += `<div class="skills-grid">`;
-                skills.flat.forEach(skill => {
-                    html += `<div class="skill-item">${skill}</div>`;
-                });
-                html += `</div>`;
-            } else if (Array.isArray(skills)) {
-                // Direct array
-                html += `<div class="skills-grid">`;
-                skills.forEach(skill => {
-                    html += `<div class="skill-item">${skill}</div>`;
-                });
-                html += `</div>`;
+                const flat = Array.isArray(skills) ? skills : (skills.skills_flat || skills.flat);
+                if (flat) {
+                    frag.appendChild(skillsGrid(flat));
+                }
             }
-            
-            skillsContent.innerHTML = html;
+
+            skillsContent.replaceChildren(frag);
             skillsSection.style.display = 'block';
         }
 
@@ -535,8 +653,8 @@ HTML_TEMPLATE = """
                         }
                         
                         // Show PDF comparison if available
-                        if (result.before_pdf && result.after_pdf) {
-                            showPDFComparison(result.before_pdf, result.after_pdf);
+                        if (result.before_pdf_url && result.after_pdf_url) {
+                            showPDFComparison(result.before_pdf_url, result.after_pdf_url);
                         }
                     } else {
                         showStatus(`❌ Error: ${result.error}`, 'error');
@@ -554,11 +672,6 @@ HTML_TEMPLATE = """
         }
 
         function showChangesSummary(changes) {
-            const summaryDiv = document.getElementById('changesSummary');
-            const contentDiv = document.getElementById('changesContent');
-            
-            let html = '';
-            
             // Group changes by section
             const sections = {};
             
@@ -602,90 +715,87 @@ HTML_TEMPLATE = """
                 };
             }
             
-            // Generate HTML for each section
+            // Build the DOM for each section
+            const frag = document.createDocumentFragment();
             for (const [sectionName, sectionChanges] of Object.entries(sections)) {
-                html += `<div class="change-section">
-                    <h4 class="change-header">${sectionName}</h4>
-                    <div class="change-content">`;
-                
+                const section = el('div', 'change-section');
+                const content = el('div', 'change-content');
+                section.append(el('h4', 'change-header', sectionName), content);
+
                 // Added skills
                 sectionChanges.added.forEach(change => {
-                    html += `<div class="skill-change added">
-                        <span class="change-icon">+</span>
-                        <span class="skill-name">${change.skill}</span>
-                        <span class="skill-reason">${change.reason || 'Added from job requirements'}</span>
-                    </div>`;
+                    content.appendChild(changeRow('added', '+', change.skill,
+                        change.reason || 'Added from job requirements'));
                 });
-                
+
                 // Removed skills
                 sectionChanges.removed.forEach(change => {
-                    html += `<div class="skill-change removed">
-                        <span class="change-icon">−</span>
-                        <span class="skill-name">${change.skill}</span>
-                        <span class="skill-reason">${change.reason || 'Removed to make room for job-relevant skills'}</span>
-                    </div>`;
+                    content.appendChild(changeRow('removed', '−', change.skill,
+                        change.reason || 'Removed to make room for job-relevant skills'));
                 });
-                
+
                 // Skipped skills
                 sectionChanges.skipped.forEach(change => {
-                    html += `<div class="skill-change skipped">
-                        <span class="change-icon">⚠</span>
-                        <span class="skill-name">${change.skill}</span>
-                        <span class="skill-reason">${change.reason || 'Skipped - reason not specified'}</span>
-                    </div>`;
+                    content.appendChild(changeRow('skipped', '⚠', change.skill,
+                        change.reason || 'Skipped - reason not specified'));
                 });
-                
+
                 // Summary changes (special handling)
                 if (sectionChanges.summary_change) {
                     const summaryChange = sectionChanges.summary_change;
-                    html += `<div class="skill-change added">
-                        <span class="change-icon">✏️</span>
-                        <span class="skill-name">Professional Summary</span>
-                        <span class="skill-reason">${summaryChange.reason}</span>
-                    </div>`;
-                    
-                    // Add expandable before/after comparison
-                    html += `<div style="margin-top: 10px;">
-                        <details style="background: #f8f9fa; padding: 10px; border-radius: 4px;">
-                            <summary style="cursor: pointer; font-weight: 600;">View Summary Changes</summary>
-                            <div style="margin-top: 10px;">
-                                <div style="margin-bottom: 10px;">
-                                    <strong>Before:</strong>
-                                    <div style="background: #fff; padding: 8px; border-radius: 4px; font-style: italic; margin-top: 4px;">
-                                        ${summaryChange.original}
-                                    </div>
-                                </div>
-                                <div>
-                                    <strong>After:</strong>
-                                    <div style="background: #fff; padding: 8px; border-radius: 4px; font-style: italic; margin-top: 4px;">
-                                        ${summaryChange.revised}
-                                    </div>
-                                </div>
-                            </div>
-                        </details>
-                    </div>`;
+                    content.append(
+                        changeRow('added', '✏️', 'Professional Summary', summaryChange.reason),
+                        summaryDetails(summaryChange));
                 }
-                
-                html += `</div></div>`;
+
+                frag.appendChild(section);
             }
-            
-            if (!html) {
-                html = '<p>No specific changes detected. Skills may have been reorganized or optimized.</p>';
+
+            if (!frag.hasChildNodes()) {
+                frag.appendChild(el('p', '', 'No specific changes detected. Skills may have been reorganized or optimized.'));
             }
-            
-            contentDiv.innerHTML = html;
-            summaryDiv.style.display = 'block';
+
+            changesContent.replaceChildren(frag);
+            changesSummary.style.display = 'block';
         }
 
-        function showPDFComparison(beforePDF, afterPDF) {
-            const comparison = document.getElementById('pdfComparison');
-            const beforeEmbed = document.getElementById('beforePDF');
-            const afterEmbed = document.getElementById('afterPDF');
-            
-            beforeEmbed.src = `data:application/pdf;base64,${beforePDF}`;
-            afterEmbed.src = `data:application/pdf;base64,${afterPDF}`;
-            
-            comparison.style.display = 'block';
+        function changeRow(kind, icon, name, reason) {
+            const row = el('div', `skill-change ${kind}`);
+            row.append(el('span', 'change-icon', icon), el('span', 'skill-name', name),
+                       el('span', 'skill-reason', reason));
+            return row;
+        }
+
+        function summaryDetails(summaryChange) {
+            // Expandable before/after comparison of the professional summary
+            const wrapper = el('div');
+            wrapper.style.marginTop = '10px';
+            const details = el('details');
+            details.style.cssText = 'background: #f8f9fa; padding: 10px; border-radius: 4px;';
+            const toggle = el('summary', '', 'View Summary Changes');
+            toggle.style.cssText = 'cursor: pointer; font-weight: 600;';
+            const body = el('div');
+            body.style.marginTop = '10px';
+
+            for (const [label, text] of [['Before:', summaryChange.original], ['After:', summaryChange.revised]]) {
+                const block = el('div');
+                block.style.marginBottom = '10px';
+                const value = el('div', '', text);
+                value.style.cssText = 'background: #fff; padding: 8px; border-radius: 4px; font-style: italic; margin-top: 4px;';
+                block.append(el('strong', '', label), value);
+                body.appendChild(block);
+            }
+
+            details.append(toggle, body);
+            wrapper.appendChild(details);
+            return wrapper;
+        }
+
+        function showPDFComparison(beforeUrl, afterUrl) {
+            beforePDF.src = beforeUrl;
+            afterPDF.src = afterUrl;
+
+            pdfComparison.style.display = 'block';
         }
 
         async function resetBaseline() {
@@ -723,14 +833,233 @@ HTML_TEMPLATE = """
 </html>
 """
 
-# Store processing results temporarily
-processing_results = {}
+
+def precompress(body: bytes) -> Dict[str, bytes]:
+    """Encode a static payload once per supported Content-Encoding"""
+    variants = {'gzip': gzip.compress(body, 9), 'identity': body}
+    if brotli is not None:
+        variants['br'] = brotli.compress(body, quality=11)
+    return variants
+
+
+def static_response(variants: Dict[str, bytes], etag: str, mimetype: str, max_age: int,
+                    immutable: bool = False) -> Response:
+    """Serve the best pre-encoded variant for the client, honouring If-None-Match"""
+    encoding = request.accept_encodings.best_match(list(variants)) or 'identity'
+    response = Response(variants[encoding], mimetype=mimetype)
+    if encoding != 'identity':
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    response.set_etag(f'{etag}-{encoding}')
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    response.cache_control.immutable = immutable
+    return response.make_conditional(request)
+
+
+# Static assets split out of HTML_TEMPLATE, by content-hashed filename:
+# name -> (encoded variants, etag, mimetype)
+STATIC_ASSETS: Dict[str, Tuple[Dict[str, bytes], str, str]] = {}
+
+
+def extract_asset(html: str, open_tag: str, close_tag: str, ext: str, mimetype: str,
+                  reference: str) -> str:
+    """
+    Move the inline block between open_tag/close_tag into STATIC_ASSETS under a
+    content-hashed name and return the HTML with `reference` in its place.
+    Because the name changes whenever the content does, browsers can cache it forever.
+    """
+    start = html.index(open_tag)
+    end = html.index(close_tag, start) + len(close_tag)
+    body = html[start + len(open_tag):end - len(close_tag)].encode('utf-8')
+    digest = hashlib.sha1(body).hexdigest()[:10]
+    name = f'app.{digest}.{ext}'
+    STATIC_ASSETS[name] = (precompress(body), digest, mimetype)
+    return html[:start] + reference.format(url=f'/assets/{name}') + html[end:]
+
+
+PAGE_HTML = extract_asset(HTML_TEMPLATE, '<style>', '</style>', 'css', 'text/css',
+                          '<link rel="stylesheet" href="{url}">')
+PAGE_HTML = extract_asset(PAGE_HTML, '<script>', '</script>', 'js', 'text/javascript',
+                          '<script src="{url}"></script>')
+
+# The page has no template variables, so it is encoded (and compressed) once
+# at import and served as static bytes with a content-hash ETag
+INDEX_HTML = PAGE_HTML.encode('utf-8')
+INDEX_ETAG = hashlib.md5(INDEX_HTML).hexdigest()
+INDEX_VARIANTS = precompress(INDEX_HTML)
+
+# Store processing results temporarily, least recently used first
+MAX_SESSIONS = 256
+SESSION_TTL_SECONDS = 3600
+JANITOR_INTERVAL_SECONDS = 300
+processing_results: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+results_lock = threading.Lock()
+
+
+# Most recent JD session, so /update-resume doesn't have to scan for it
+latest_jd_session: Optional[str] = None
+latest_session_lock = threading.Lock()
+
+
+def unreferenced_dirs(temp_dirs: set) -> set:
+    """Temp dirs no stored result still points at; call with results_lock held"""
+    # A JD session and its final result share a temp dir; keep it while either is live
+    return temp_dirs - {v['temp_dir'] for v in processing_results.values()}
+
+
+def store_result(result_id: str, data: Dict[str, Any]) -> None:
+    """Record a session/result as most recent, evicting the oldest past MAX_SESSIONS"""
+    data['last_used'] = time.monotonic()
+    with results_lock:
+        processing_results[result_id] = data
+        processing_results.move_to_end(result_id)
+        evicted_dirs = set()
+        while len(processing_results) > MAX_SESSIONS:
+            evicted_dirs.add(processing_results.popitem(last=False)[1]['temp_dir'])
+        evicted_dirs = unreferenced_dirs(evicted_dirs)
+
+    # Evicted sessions would otherwise leave their artifacts and PDFs in /tmp
+    for temp_dir in evicted_dirs:
+        release_session_dir(temp_dir)
+
+
+# Session scratch lives on tmpfs when available: JD artifacts, pdflatex's
+# aux/log files and the preview PDFs are all short-lived, so skip the disk
+SCRATCH_ROOT = '/dev/shm' if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK) else None
+
+def get_result(result_id: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    Look up a stored session/result, marking it most recently used. Entries
+    idle past SESSION_TTL_SECONDS count as missing even before the janitor
+    runs; each access restarts the TTL, so the janitor never expires a session
+    an /update-resume has just picked up.
+    """
+    if result_id is None:
+        return None
+    with results_lock:
+        data = processing_results.get(result_id)
+        now = time.monotonic()
+        if data is None or data['last_used'] < now - SESSION_TTL_SECONDS:
+            return None
+        data['last_used'] = now
+        processing_results.move_to_end(result_id)
+        return data
+
+
+# Emptied session directories kept for reuse, so a new session skips
+# mkdtemp and re-creating its artifacts/ and after/ subdirectories
+MAX_POOLED_DIRS = 8
+free_session_dirs: List[str] = []
+session_dirs_lock = threading.Lock()
+
+# Session dir -> stage that timed out while still running in it (see run_stage)
+overrunning_stages: Dict[str, Future] = {}
+
+
+def acquire_session_dir() -> str:
+    """Take an empty session directory from the pool, or create a new one"""
+    with session_dirs_lock:
+        if free_session_dirs:
+            return free_session_dirs.pop()
+    return tempfile.mkdtemp(prefix='jd_processing_', dir=SCRATCH_ROOT)
+
+
+def release_session_dir(temp_dir: str) -> None:
+    """Empty a session directory and return it to the pool, or delete it if the pool is full"""
+    with session_dirs_lock:
+        overrun = overrunning_stages.pop(temp_dir, None)
+    if overrun is not None:
+        # A timed-out stage may still write here: never reuse the dir, and
+        # delete it only once that stage has finished
+        overrun.add_done_callback(lambda _: shutil.rmtree(temp_dir, ignore_errors=True))
+        return
+
+    try:
+        for root, _, files in os.walk(temp_dir):
+            for name in files:
+                os.unlink(os.path.join(root, name))
+    except OSError:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        return
+
+    with session_dirs_lock:
+        if len(free_session_dirs) < MAX_POOLED_DIRS:
+            free_session_dirs.append(temp_dir)
+            return
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def purge_expired_results() -> None:
+    """Drop results unused for SESSION_TTL_SECONDS and recycle their temp dirs"""
+    cutoff = time.monotonic() - SESSION_TTL_SECONDS
+    with results_lock:
+        expired = [k for k, v in processing_results.items() if v['last_used'] < cutoff]
+        expired_dirs = unreferenced_dirs({processing_results.pop(k)['temp_dir'] for k in expired})
+
+    for temp_dir in expired_dirs:
+        release_session_dir(temp_dir)
+    if expired:
+        logger.info(f"🧹 Expired {len(expired)} stored result(s)")
+
+
+def run_result_janitor() -> None:
+    """Purge expired results, then reschedule itself every JANITOR_INTERVAL_SECONDS"""
+    try:
+        purge_expired_results()
+    finally:
+        timer = threading.Timer(JANITOR_INTERVAL_SECONDS, run_result_janitor)
+        timer.daemon = True
+        timer.start()
+
+
+@atexit.register
+def remove_session_dirs() -> None:
+    """Delete the temp dirs of all sessions still held (or pooled) at shutdown"""
+    for temp_dir in {v['temp_dir'] for v in processing_results.values()} | set(free_session_dirs):
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+run_result_janitor()
 
 
 @app.route('/')
 def index():
     """Serve the main web interface"""
-    return render_template_string(HTML_TEMPLATE)
+    return static_response(INDEX_VARIANTS, INDEX_ETAG, 'text/html', 300)
+
+
+@app.route('/assets/<name>')
+def static_asset(name):
+    """Serve a CSS/JS asset split out of the page; names are content-hashed, so cache forever"""
+    asset = STATIC_ASSETS.get(name)
+    if asset is None:
+        return "Asset not found", 404
+
+    variants, etag, mimetype = asset
+    return static_response(variants, etag, mimetype, 31536000, immutable=True)
+
+
+def register_jd_session(temp_dir: str, result: Dict[str, Any]) -> str:
+    """Store a parsed JD session, make it the one /update-resume uses, and return its ID"""
+    global latest_jd_session
+    # Random ID: timestamp+pid IDs collided for two sessions in the same second
+    download_id = uuid.uuid4().hex
+
+    # Store result for this session
+    store_result(download_id, {
+        'temp_dir': temp_dir,
+        'skills_count': result['skills_count'],
+        'skills_data': result['skills_data']
+    })
+    with latest_session_lock:
+        latest_jd_session = download_id
+    return download_id
+
+
+def sse_event(event: str, data: Any) -> bytes:
+    """Encode one Server-Sent Events frame with a JSON payload"""
+    return b'event: ' + event.encode() + b'\ndata: ' + orjson.dumps(data, option=ORJSON_OPTIONS) + b'\n\n'
 
 
 @app.route('/process-jd', methods=['POST'])
@@ -739,36 +1068,32 @@ def process_job_description():
     try:
         data = request.get_json()
         if not data or 'job_description' not in data:
-            return jsonify({'success': False, 'error': 'No job description provided'}), 400
+            return json_response({'success': False, 'error': 'No job description provided'}, 400)
 
         job_description = data['job_description'].strip()
         if not job_description:
-            return jsonify({'success': False, 'error': 'Job description cannot be empty'}), 400
-
-        # Create temporary directory for this processing session
-        temp_dir = tempfile.mkdtemp(prefix='jd_processing_')
-        temp_jd_file = Path(temp_dir) / 'jd.txt'
-
-        # Write JD to temporary file
-        temp_jd_file.write_text(job_description, encoding='utf-8')
-
-        # Create or use permanent baseline backup for "before" comparison
-        baseline_backup_successful = ensure_baseline_backup()
-
-        # Run the JD parsing pipeline
-        result = run_jd_parsing(str(temp_jd_file), temp_dir)
+            return json_response({'success': False, 'error': 'Job description cannot be empty'}, 400)
+
+        # Temporary directory for this processing session's artifacts
+        temp_dir = acquire_session_dir()
+
+        try:
+            # Create or use permanent baseline backup for "before" comparison.
+            # It may need a LaTeX compile, so let it overlap with JD parsing
+            # (run_jd_parsing stays on this thread since it uses EXECUTOR itself).
+            baseline_future = EXECUTOR.submit(ensure_baseline_backup)
+
+            # Run the JD parsing pipeline
+            result = run_jd_parsing(job_description, temp_dir)
+            if not baseline_future.result():
+                # Parsing still succeeded; only the before/after comparison is lost
+                logger.warning("⚠️ No baseline backup available; the before/after PDF comparison will be skipped")
+        except Exception:
+            release_session_dir(temp_dir)
+            raise
 
         if result['success']:
-            # Generate unique download ID for this session
-            download_id = f"jd_session_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.getpid()}"
-
-            # Store result for this session
-            processing_results[download_id] = {
-                'temp_dir': temp_dir,
-                'skills_count': result['skills_count'],
-                'skills_data': result['skills_data'],
-                'jd_file': str(temp_jd_file)
-            }
+            download_id = register_jd_session(temp_dir, result)
 
             response_data = {
                 'success': True,
@@ -777,61 +1102,91 @@ def process_job_description():
                 'skills': result['skills_data']
             }
 
-            return jsonify(response_data)
+            return json_response(response_data)
         else:
-            return jsonify({'success': False, 'error': result['error']}), 500
+            release_session_dir(temp_dir)
+            return json_response({'success': False, 'error': result['error']}, 500)
 
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return json_response({'success': False, 'error': str(e)}, 500)
+
+
+@app.route('/process-jd-stream', methods=['POST'])
+def process_job_description_stream():
+    """
+    Same as /process-jd, but streams Server-Sent Events as stages finish:
+    `progress` messages, `skills` once extraction is done, then `done`
+    (or `error`)
+    """
+    data = request.get_json(silent=True) or {}
+    job_description = (data.get('job_description') or '').strip()
+    if not job_description:
+        return json_response({'success': False, 'error': 'Job description cannot be empty'}, 400)
+
+    def generate():
+        yield sse_event('progress', {'message': 'Processing job description and extracting skills...'})
+
+        # Acquired after the first yield: a client that disconnects before
+        # then closes the generator without ever taking a directory
+        temp_dir = acquire_session_dir()
+        try:
+            baseline_future = EXECUTOR.submit(ensure_baseline_backup)
+            result = run_jd_parsing(job_description, temp_dir)
+            if not result['success']:
+                release_session_dir(temp_dir)
+                yield sse_event('error', {'error': result['error']})
+                return
+            download_id = register_jd_session(temp_dir, result)
+        except Exception as e:
+            release_session_dir(temp_dir)
+            yield sse_event('error', {'error': str(e)})
+            return
+
+        yield sse_event('skills', {
+            'download_id': download_id,
+            'skills_count': result['skills_count'],
+            'skills': result['skills_data']
+        })
+        baseline_future.result()
+        yield sse_event('done', {'download_id': download_id})
+
+    return Response(generate(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
 
 @app.route('/update-resume', methods=['POST'])
 def update_resume():
     """Update the resume with extracted skills"""
     try:
-        # Find the most recent JD session
-        jd_sessions = [k for k in processing_results.keys()
-                       if k.startswith('jd_session_')]
-        if not jd_sessions:
-            return jsonify({'success': False, 'error': 'No job description session found. Please process a job description first.'}), 400
-
-        # Get the most recent session
-        latest_session = max(
-            jd_sessions, key=lambda x: processing_results[x].get('temp_dir', ''))
-        session_data = processing_results[latest_session]
-
-        # Run the resume update pipeline
+        # Use the most recent JD session, if it hasn't been evicted or expired
+        with latest_session_lock:
+            latest_session = latest_jd_session
+        session_data = get_result(latest_session)
+        if session_data is None:
+            return json_response({'success': False, 'error': 'No job description session found. Please process a job description first.'}, 400)
+
+        # Run the resume update pipeline (serialized with other updates by
+        # resume_lock, see run_updater_stages)
         result = run_resume_update(session_data['temp_dir'])
 
         if result['success']:
-            # Generate PDFs for comparison
-            before_pdf_b64 = None
-            after_pdf_b64 = None
-
-            # Get before PDF (from permanent baseline backup)
-            before_pdf_path = Path('baseline_backup/Conner_Jordan_Software_Engineer.pdf')
-            if before_pdf_path.exists():
-                before_pdf_b64 = pdf_to_base64(str(before_pdf_path))
-
-            # Generate after PDF (compile updated resume)
-            resume_tex = Path('Resume/Conner_Jordan_Software_Engineer.tex')
-            if resume_tex.exists():
-                after_pdf_path = compile_latex_to_pdf(
-                    str(resume_tex), str(Path(session_data['temp_dir']) / 'after'))
-                if after_pdf_path:
-                    after_pdf_b64 = pdf_to_base64(after_pdf_path)
+            # Generate PDFs for comparison: the before branch (which may
+            # still need its own LaTeX compile) runs alongside the after one
+            before_future = EXECUTOR.submit(snapshot_baseline_pdf, session_data['temp_dir'])
+            after_pdf = compile_after_pdf(session_data['temp_dir'])
+            before_pdf = before_future.result()
 
             # Generate unique download ID for the final result
-            download_id = f"final_result_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.getpid()}"
+            download_id = uuid.uuid4().hex
 
             # Store final result for download
-            processing_results[download_id] = {
+            store_result(download_id, {
                 'temp_dir': session_data['temp_dir'],
                 'skills_count': session_data['skills_count'],
                 'files': result['files'],
-                'before_pdf': before_pdf_b64,
-                'after_pdf': after_pdf_b64
-            }
+                'before_pdf': before_pdf,
+                'after_pdf': after_pdf
+            })
 
             response_data = {
                 'success': True,
@@ -839,104 +1194,249 @@ def update_resume():
                 'skills_count': session_data['skills_count']
             }
 
-            # Include PDF data if both are available
-            if before_pdf_b64 and after_pdf_b64:
-                response_data['before_pdf'] = before_pdf_b64
-                response_data['after_pdf'] = after_pdf_b64
+            # Link the PDFs (served by /preview) if both are available
+            if before_pdf and after_pdf:
+                response_data['before_pdf_url'] = f'/preview/{download_id}/before.pdf'
+                response_data['after_pdf_url'] = f'/preview/{download_id}/after.pdf'
             
             # Include changes summary if available
             if 'changes' in result:
                 response_data['changes'] = result['changes']
 
-            return jsonify(response_data)
+            return json_response(response_data)
         else:
-            return jsonify({'success': False, 'error': result['error']}), 500
+            return json_response({'success': False, 'error': result['error']}, 500)
 
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return json_response({'success': False, 'error': str(e)}, 500)
+
+
+def snapshot_baseline_pdf(temp_dir: str) -> Optional[str]:
+    """
+    Ensure the baseline backup exists and copy its PDF into the session dir,
+    so the session's "before" survives a later /reset-baseline
+    """
+    ensure_baseline_backup()
+    before_pdf = Path(temp_dir) / 'before.pdf'
+    try:
+        fast_copy(BASELINE_PDF, before_pdf)
+    except FileNotFoundError:
+        return None
+    return str(before_pdf)
+
+
+def compile_after_pdf(temp_dir: str) -> Optional[str]:
+    """
+    Compile the session's snapshot of its updated resume (see
+    run_updater_stages) into its after/ dir and return the PDF path
+    """
+    resume_tex = Path(temp_dir) / RESUME_TEX.name
+    if not resume_tex.exists():
+        return None
+    after_pdf = compile_latex_to_pdf(str(resume_tex), str(Path(temp_dir) / 'after'))
+
+    # Only the PDF is served; drop pdflatex's aux/log files so they don't sit in tmpfs
+    if after_pdf:
+        for entry in os.scandir(Path(after_pdf).parent):
+            if entry.is_file() and entry.path != after_pdf:
+                os.unlink(entry.path)
+    return after_pdf
+
+
+@app.route('/preview/<download_id>/<which>.pdf')
+def preview_pdf(download_id, which):
+    """Serve the before/after PDF of a resume update straight from disk"""
+    result = get_result(download_id)
+    if which not in ('before', 'after') or not result or not result.get(f'{which}_pdf'):
+        return "PDF not found or expired", 404
+
+    # Path-based send_file streams the file (sendfile under a WSGI server that
+    # supports it) and handles ETag / Last-Modified / Range requests
+    return send_file(result[f'{which}_pdf'], mimetype='application/pdf', conditional=True)
 
 
 @app.route('/download/<download_id>')
 def download_result(download_id):
     """Download the processed resume files as a ZIP"""
-    if download_id not in processing_results:
+    result = get_result(download_id)
+    if result is None:
         return "Download not found or expired", 404
 
     try:
-        result = processing_results[download_id]
-        temp_dir = result['temp_dir']
-
-        # Create ZIP file with results
-        zip_path = Path(temp_dir) / 'tailored_resume.zip'
-
-        with zipfile.ZipFile(zip_path, 'w') as zipf:
-            # Add artifacts
-            artifacts_dir = Path('artifacts')
-            if artifacts_dir.exists():
-                for file_path in artifacts_dir.glob('*'):
-                    if file_path.is_file():
-                        zipf.write(file_path, f'artifacts/{file_path.name}')
-
-            # Add updated resume files if they exist
-            skills_file = Path('skills.tex')
-            if skills_file.exists():
-                zipf.write(skills_file, 'skills.tex')
-
-            resume_file = Path('Resume/Conner_Jordan_Software_Engineer.tex')
-            if resume_file.exists():
-                zipf.write(
-                    resume_file, 'Resume/Conner_Jordan_Software_Engineer.tex')
-
-        # Clean up after sending
-        def remove_files():
-            try:
-                import shutil
-                shutil.rmtree(temp_dir)
-                del processing_results[download_id]
-            except:
-                pass
-
-        return send_file(
-            zip_path,
-            as_attachment=True,
-            download_name=f'tailored_resume_{download_id}.zip',
-            mimetype='application/zip'
+        entries = download_entries(result['temp_dir'])
+
+        # The result stays available until it expires (see purge_expired_results)
+        return Response(
+            stream_zip(entries),
+            mimetype='application/zip',
+            headers={'Content-Disposition': f'attachment; filename=tailored_resume_{download_id[:8]}.zip'}
         )
 
     except Exception as e:
         return f"Error creating download: {str(e)}", 500
 
 
-def run_jd_parsing(jd_file_path: str, temp_dir: str) -> Dict[str, Any]:
+def download_entries(temp_dir: str) -> List[Tuple[Path, str]]:
+    """(path, name in archive) for each file in a download"""
+    entries = []
+
+    # Add this session's artifacts
+    artifacts_dir = session_artifacts_dir(temp_dir)
+    if artifacts_dir.exists():
+        for file_path in artifacts_dir.glob('*'):
+            if file_path.is_file():
+                entries.append((file_path, f'artifacts/{file_path.name}'))
+
+    # Add updated resume files if they exist
+    for name in ('skills.tex', 'Resume/Conner_Jordan_Software_Engineer.tex'):
+        if Path(name).exists():
+            entries.append((Path(name), name))
+    return entries
+
+
+# Already-compressed formats gain nothing from deflate, and tiny files can
+# come out larger, so both are stored; text (.tex/.json) is deflated
+STORED_SUFFIXES = ('.pdf', '.png', '.jpg', '.zip', '.gz')
+MIN_DEFLATE_SIZE = 256
+DEFLATE_LEVEL = 6
+ZIP_COPY_CHUNK_SIZE = 1024 * 1024
+
+
+def zip_compression(file_path: Path) -> Tuple[int, Optional[int]]:
+    """(compress_type, compresslevel) to use for a ZIP member"""
+    if file_path.suffix.lower() in STORED_SUFFIXES or file_path.stat().st_size < MIN_DEFLATE_SIZE:
+        return zipfile.ZIP_STORED, None
+    return zipfile.ZIP_DEFLATED, DEFLATE_LEVEL
+
+
+class ZipChunkWriter(io.RawIOBase):
+    """Write-only, unseekable sink that buffers what ZipFile writes until drained"""
+
+    def __init__(self) -> None:
+        self.chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b''.join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def stream_zip(entries: List[Tuple[Path, str]]):
+    """
+    Yield a ZIP of `entries` one member at a time, so the archive is never
+    held whole in memory. Compression is chosen per member (zip_compression).
+    """
+    sink = ZipChunkWriter()
+    with zipfile.ZipFile(sink, 'w') as zipf:
+        for file_path, arcname in entries:
+            compress_type, compresslevel = zip_compression(file_path)
+            if compress_type != zipfile.ZIP_STORED:
+                zipf.write(file_path, arcname, compress_type=compress_type, compresslevel=compresslevel)
+                yield sink.drain()
+                continue
+
+            # Stored members (PDFs) are copied in large chunks rather than
+            # ZipFile.write's 8 KiB reads, and flushed to the client per chunk
+            zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+            zinfo.compress_type = zipfile.ZIP_STORED
+            with open(file_path, 'rb') as src, zipf.open(zinfo, 'w') as dst:
+                while chunk := src.read(ZIP_COPY_CHUNK_SIZE):
+                    dst.write(chunk)
+                    yield sink.drain()
+    yield sink.drain()
+
+
+@lru_cache(maxsize=8)
+def cached_skills_json(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a jd_skills.json, memoized on (path, mtime, size); treat the result as read-only"""
+    return orjson.loads(Path(path).read_bytes())
+
+
+def load_skills_json(path: Path) -> Dict[str, Any]:
+    """Load jd_skills.json, parsing it again only when the file has changed"""
+    stat = path.stat()
+    return cached_skills_json(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+# Artifacts a full run leaves in a session's artifacts dir, in report order
+SESSION_ARTIFACTS = (
+    'jd_skills.json',
+    'skills_updated_block.tex',
+    'skills_editor_output.json',
+    'summary_updated_block.tex',
+    'summary_editor_output.json',
+)
+
+
+def session_result_files(present: set) -> List[str]:
+    """Files a finished run reports, given the names found in its artifacts dir"""
+    return ([f'artifacts/{name}' for name in SESSION_ARTIFACTS if name in present]
+            + ['skills.tex', 'Resume/Conner_Jordan_Software_Engineer.tex'])
+
+
+def session_artifacts_dir(temp_dir: str) -> Path:
+    """Per-session artifacts directory, so concurrent sessions don't share files"""
+    return Path(temp_dir) / 'artifacts'
+
+
+# JD digest -> extraction currently running for it, so concurrent identical
+# submissions wait on one LLM call instead of each making their own
+inflight_extractions: Dict[bytes, Future] = {}
+inflight_lock = threading.Lock()
+
+
+def run_jd_parsing(job_description: str, temp_dir: str) -> Dict[str, Any]:
     """Run only the JD parsing part of the pipeline"""
     try:
-        print("🔧 Running jd-parser.py...")
-        
-        # Use subprocess to run jd-parser properly  
-        result = subprocess.run([
-            sys.executable, 'jd-parser.py', '--jd', jd_file_path
-        ], capture_output=True, text=True, timeout=1800)  # 30 minutes timeout
-        
-        print(f"JD-parser exit code: {result.returncode}")
-        if result.stdout:
-            print(f"JD-parser stdout: {result.stdout}")
-        if result.stderr:
-            print(f"JD-parser stderr: {result.stderr}")
-
-        if result.returncode != 0:
-            return {
-                'success': False,
-                'error': f'JD parser failed with exit code {result.returncode}: {result.stderr}'
-            }
+        artifacts_dir = session_artifacts_dir(temp_dir)
 
-        # Load and validate results
-        artifacts_path = Path('artifacts/jd_skills.json')
-        if artifacts_path.exists():
-            with open(artifacts_path, 'r') as f:
-                skills_data = json.load(f)
+        # A near-identical JD seen before extracts to the same skills
+        skills_data, cache_key = jd_cache.lookup(job_description)
+        if skills_data is not None:
+            logger.info("♻️  Reusing skills from a previously seen job description")
+            write_json_atomic(artifacts_dir / 'jd_skills.json', skills_data)
+        else:
+            # Identical JDs submitted together share one extraction
+            digest = cache_key[0]
+            with inflight_lock:
+                pending = inflight_extractions.get(digest)
+                owner = pending is None
+                if owner:
+                    pending = inflight_extractions[digest] = Future()
+
+            if owner:
+                try:
+                    logger.info("🔧 Running jd-parser...")
+                    # The parser returns the payload it wrote to jd_skills.json, so use
+                    # it directly instead of reading the file back
+                    skills_data = run_stage(jd_parser.run, 1800, jd_text=job_description,
+                                            artifacts_dir=str(artifacts_dir))  # 30 minutes timeout
+                    if skills_data:
+                        jd_cache.store(cache_key, skills_data)
+                    pending.set_result(skills_data)
+                except BaseException as e:
+                    pending.set_exception(e)
+                    raise
+                finally:
+                    with inflight_lock:
+                        inflight_extractions.pop(digest, None)
+            else:
+                logger.info("⏳ Waiting for the same job description already being parsed")
+                skills_data = pending.result(timeout=1800)
+                if skills_data:
+                    write_json_atomic(artifacts_dir / 'jd_skills.json', skills_data)
 
+        # Validate results
+        if skills_data:
             skills_count = len(skills_data.get('skills_flat', []))
-            print(f"✅ JD parsing completed - extracted {skills_count} skills")
+            logger.info(f"✅ JD parsing completed - extracted {skills_count} skills")
 
             return {
                 'success': True,
@@ -946,72 +1446,139 @@ def run_jd_parsing(jd_file_path: str, temp_dir: str) -> Dict[str, Any]:
         else:
             return {'success': False, 'error': 'Failed to extract skills from job description'}
 
-    except subprocess.TimeoutExpired:
+    except FuturesTimeoutError:
         return {'success': False, 'error': 'JD parser timed out after 30 minutes'}
+    except SystemExit as e:
+        return {'success': False, 'error': f'JD parser failed: {e}'}
     except Exception as e:
         return {'success': False, 'error': f'JD parsing failed: {str(e)}'}
 
 
+# Permanent "before" snapshot of the resume used for every comparison
+BASELINE_DIR = Path('baseline_backup')
+BASELINE_TEX = BASELINE_DIR / 'Conner_Jordan_Software_Engineer.tex'
+BASELINE_PDF = BASELINE_DIR / 'Conner_Jordan_Software_Engineer.pdf'
+
+# mtime of BASELINE_DIR when the baseline was last verified. Adding or
+# removing a file changes the directory's mtime, so a matching value means
+# the check can be skipped; /reset-baseline clears it.
+baseline_verified_mtime: Optional[int] = None
+
+
+def baseline_dir_mtime() -> Optional[int]:
+    """mtime_ns of BASELINE_DIR, or None if it doesn't exist"""
+    try:
+        return os.stat(BASELINE_DIR).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+# Serializes building and swapping in a new baseline
+baseline_lock = threading.Lock()
+
+# Serializes the updaters, which rewrite the shared resume files (see
+# run_updater_stages and run_pipeline_stages)
+resume_lock = threading.Lock()
+RESUME_TEX = Path('Resume/Conner_Jordan_Software_Engineer.tex')
+
+
+def build_baseline(target_dir: Path) -> bool:
+    """Copy the current resume TEX/PDF into `target_dir`, compiling the PDF if missing"""
+    target_dir.mkdir(exist_ok=True)
+
+    # Copy current resume files to baseline backup. The updaters rewrite these
+    # files in place, so they're copied rather than hard-linked
+    current_tex = Path('Resume/Conner_Jordan_Software_Engineer.tex')
+    current_pdf = Path('Resume/Conner_Jordan_Software_Engineer.pdf')
+
+    if current_tex.exists():
+        fast_copy(current_tex, target_dir / BASELINE_TEX.name)
+        logger.info(f"✅ Backed up baseline TEX: {current_tex} -> {BASELINE_TEX}")
+    else:
+        logger.warning(f"⚠️  Warning: Could not find current resume TEX file: {current_tex}")
+
+    if current_pdf.exists():
+        fast_copy(current_pdf, target_dir / BASELINE_PDF.name)
+        logger.info(f"✅ Backed up baseline PDF: {current_pdf} -> {BASELINE_PDF}")
+    else:
+        # Generate PDF from TEX if PDF doesn't exist
+        if current_tex.exists():
+            logger.info("📄 Generating baseline PDF from TEX...")
+            pdf_path = compile_latex_to_pdf(str(current_tex), str(target_dir))
+            if pdf_path:
+                logger.info(f"✅ Generated baseline PDF: {pdf_path}")
+            else:
+                logger.error("❌ Failed to generate baseline PDF")
+                return False
+        else:
+            logger.error("❌ Cannot create baseline backup - no TEX or PDF file found")
+            return False
+    return True
+
+
+def staging_baseline_dir() -> Path:
+    """Fresh sibling of BASELINE_DIR to build a baseline in before renaming it into place"""
+    return BASELINE_DIR.with_name(f'{BASELINE_DIR.name}.new-{time.time_ns()}')
+
+
+def install_baseline(staging_dir: Path) -> None:
+    """Swap a fully built baseline into BASELINE_DIR; call with baseline_lock held"""
+    # Move any existing baseline aside (a single rename) and delete it in the
+    # background so the caller doesn't wait on the directory walk
+    if os.path.lexists(BASELINE_DIR):
+        stale_dir = BASELINE_DIR.with_name(f'{BASELINE_DIR.name}.old-{time.time_ns()}')
+        BASELINE_DIR.rename(stale_dir)
+        IO_EXECUTOR.submit(shutil.rmtree, stale_dir, ignore_errors=True)
+    staging_dir.rename(BASELINE_DIR)
+
+
 def ensure_baseline_backup() -> bool:
     """
     Ensure we have a permanent baseline backup of the original resume.
     This backup will never be updated and serves as the 'before' state for all comparisons.
     """
+    global baseline_verified_mtime
+    if baseline_verified_mtime is not None and baseline_verified_mtime == baseline_dir_mtime():
+        return True
+
     try:
-        baseline_dir = Path('baseline_backup')
-        baseline_tex = baseline_dir / 'Conner_Jordan_Software_Engineer.tex'
-        baseline_pdf = baseline_dir / 'Conner_Jordan_Software_Engineer.pdf'
-        
-        # If baseline backup already exists, don't overwrite it
-        if baseline_dir.exists() and baseline_tex.exists() and baseline_pdf.exists():
-            print("✅ Using existing baseline backup")
-            return True
-            
-        print("📁 Creating baseline backup (first time setup)...")
-        baseline_dir.mkdir(exist_ok=True)
-        
-        # Copy current resume files to baseline backup
-        current_tex = Path('Resume/Conner_Jordan_Software_Engineer.tex')
-        current_pdf = Path('Resume/Conner_Jordan_Software_Engineer.pdf')
-        
-        if current_tex.exists():
-            shutil.copy2(current_tex, baseline_tex)
-            print(f"✅ Backed up baseline TEX: {current_tex} -> {baseline_tex}")
-        else:
-            print(f"⚠️  Warning: Could not find current resume TEX file: {current_tex}")
-            
-        if current_pdf.exists():
-            shutil.copy2(current_pdf, baseline_pdf)
-            print(f"✅ Backed up baseline PDF: {current_pdf} -> {baseline_pdf}")
-        else:
-            # Generate PDF from TEX if PDF doesn't exist
-            if current_tex.exists():
-                print("📄 Generating baseline PDF from TEX...")
-                pdf_path = compile_latex_to_pdf(str(current_tex), str(baseline_dir))
-                if pdf_path:
-                    print(f"✅ Generated baseline PDF: {pdf_path}")
-                else:
-                    print("❌ Failed to generate baseline PDF")
-                    return False
-            else:
-                print("❌ Cannot create baseline backup - no TEX or PDF file found")
+        with baseline_lock:
+            # If baseline backup already exists, don't overwrite it
+            if BASELINE_DIR.exists() and BASELINE_TEX.exists() and BASELINE_PDF.exists():
+                logger.info("✅ Using existing baseline backup")
+                baseline_verified_mtime = baseline_dir_mtime()
+                return True
+
+            logger.info("📁 Creating baseline backup (first time setup)...")
+
+            # Build alongside and rename into place, so readers never see a
+            # half-written baseline
+            staging_dir = staging_baseline_dir()
+            if not build_baseline(staging_dir):
+                shutil.rmtree(staging_dir, ignore_errors=True)
                 return False
-        
-        print("✅ Baseline backup created successfully")
-        return True
-        
+            install_baseline(staging_dir)
+
+            logger.info("✅ Baseline backup created successfully")
+            baseline_verified_mtime = baseline_dir_mtime()
+            return True
+
     except Exception as e:
-        print(f"❌ Failed to create baseline backup: {e}")
+        logger.error(f"❌ Failed to create baseline backup: {e}")
         return False
 
-def parse_all_changes(temp_dir: str) -> Optional[Dict[str, Any]]:
-    """Parse changes from both skills and summary editor outputs"""
+def parse_all_changes(sources: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Parse changes from both skills and summary editor outputs. `sources`
+    holds what the updaters returned (see run_resume_update); missing
+    entries are None.
+    """
     try:
         # Get skills changes
-        skills_changes = parse_skills_changes(temp_dir)
+        skills_changes = parse_skills_changes(sources)
         
         # Get summary changes
-        summary_changes = parse_summary_changes(temp_dir)
+        summary_changes = parse_summary_changes(sources)
         
         # Combine changes
         all_changes = {
@@ -1034,19 +1601,15 @@ def parse_all_changes(temp_dir: str) -> Optional[Dict[str, Any]]:
         return all_changes if (all_changes['added'] or all_changes['removed'] or all_changes['skipped'] or all_changes['summary_updated']) else None
         
     except Exception as e:
-        print(f"Warning: Could not parse changes: {e}")
+        logger.warning(f"Warning: Could not parse changes: {e}")
         return None
 
-def parse_summary_changes(temp_dir: str) -> Optional[Dict[str, Any]]:
+def parse_summary_changes(sources: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """Parse changes from the summary editor output"""
     try:
-        summary_output_path = Path('artifacts/summary_editor_output.json')
-        
-        if not summary_output_path.exists():
+        summary_output = sources['summary_editor_output']
+        if summary_output is None:
             return None
-            
-        with open(summary_output_path, 'r') as f:
-            summary_output = json.load(f)
         
         original_summary = summary_output.get('original_summary', '')
         revised_summary = summary_output.get('revised_summary', '')
@@ -1062,24 +1625,21 @@ def parse_summary_changes(temp_dir: str) -> Optional[Dict[str, Any]]:
         return None
         
     except Exception as e:
-        print(f"Warning: Could not parse summary changes: {e}")
+        logger.warning(f"Warning: Could not parse summary changes: {e}")
         return None
 
-def parse_skills_changes(temp_dir: str) -> Optional[Dict[str, Any]]:
+# Lowercased skill tokens ("c++", "node.js", "ci/cd" -> "ci", "cd") used to
+# check which extracted skills made it into the updated skills block
+SKILL_TOKEN_PATTERN = re.compile(r'[a-z0-9+.#-]{2,}')
+
+
+def parse_skills_changes(sources: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """Parse changes from the skills editor output and extract added/removed/skipped skills"""
     try:
-        # Read the skills editor output
-        editor_output_path = Path('artifacts/skills_editor_output.json')
-        jd_skills_path = Path('artifacts/jd_skills.json')
-        
-        if not editor_output_path.exists() or not jd_skills_path.exists():
+        editor_output = sources['skills_editor_output']
+        jd_skills = sources['jd_skills']
+        if editor_output is None or jd_skills is None:
             return None
-            
-        with open(editor_output_path, 'r') as f:
-            editor_output = json.load(f)
-            
-        with open(jd_skills_path, 'r') as f:
-            jd_skills = json.load(f)
         
         changes = {
             'added': [],
@@ -1114,112 +1674,88 @@ def parse_skills_changes(temp_dir: str) -> Optional[Dict[str, Any]]:
         
         # Identify skills that were extracted but not added (skipped)
         jd_skills_flat = jd_skills.get('skills_flat', [])
-        added_skills_list = [change['skill'] for change in changes['added']]
-        
+        added_skills_set = {change['skill'] for change in changes['added']}
+
+        # Section each skill would belong to (first ranked entry wins)
+        section_by_canonical = {}
+        for ranked_skill in jd_skills.get('job_skills_ranked', []):
+            section_by_canonical.setdefault(
+                ranked_skill.get('canonical'), ranked_skill.get('section', 'Unknown'))
+
         # Read the current skills to see what was actually added
-        skills_updated_path = Path('artifacts/skills_updated_block.tex')
-        if skills_updated_path.exists():
-            updated_skills_content = skills_updated_path.read_text()
-            
+        updated_skills_content = sources['skills_updated_block']
+        if updated_skills_content is not None:
+
+            # Tokenize the block once; a skill counts as present when all of
+            # its tokens appear, instead of substring-scanning per skill
+            tokens_in_tex = set(SKILL_TOKEN_PATTERN.findall(updated_skills_content.lower()))
+
             for skill in jd_skills_flat:
-                if skill not in added_skills_list and skill not in updated_skills_content:
+                skill_tokens = SKILL_TOKEN_PATTERN.findall(skill.lower())
+                if skill not in added_skills_set and not tokens_in_tex.issuperset(skill_tokens):
                     # This skill was extracted but not added
-                    # Try to determine which section it would belong to
-                    skill_section = 'Unknown'
-                    for ranked_skill in jd_skills.get('job_skills_ranked', []):
-                        if ranked_skill.get('canonical') == skill:
-                            skill_section = ranked_skill.get('section', 'Unknown')
-                            break
-                    
                     changes['skipped'].append({
                         'skill': skill,
-                        'section': skill_section,
+                        'section': section_by_canonical.get(skill, 'Unknown'),
                         'reason': 'Not added - may be irrelevant to section or already present'
                     })
         
         return changes if (changes['added'] or changes['removed'] or changes['skipped']) else None
         
     except Exception as e:
-        print(f"Warning: Could not parse skills changes: {e}")
+        logger.warning(f"Warning: Could not parse skills changes: {e}")
         return None
 
+def write_json_atomic(path: Path, data: Dict[str, Any]) -> None:
+    """Write JSON via a temp file + os.replace so a concurrent reader never sees a torn file"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.json.tmp')
+    tmp_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_path, path)
+
+
 def run_resume_update(temp_dir: str) -> Dict[str, Any]:
     """Run only the resume update part of the pipeline"""
     try:
-        print("🔧 Running skills-updater.py...")
-        
-        # Step 1: Use subprocess to run skills-updater
-        skills_result = subprocess.run([
-            sys.executable, 'skills-updater.py'
-        ], capture_output=True, text=True, timeout=300)
-        
-        print(f"Skills-updater exit code: {skills_result.returncode}")
-        if skills_result.stdout:
-            print(f"Skills-updater stdout: {skills_result.stdout}")
-        if skills_result.stderr:
-            print(f"Skills-updater stderr: {skills_result.stderr}")
+        artifacts_dir = session_artifacts_dir(temp_dir)
+        jd_skills = str(artifacts_dir / 'jd_skills.json')
 
-        if skills_result.returncode != 0:
-            return {
-                'success': False,
-                'error': f'Skills updater failed with exit code {skills_result.returncode}: {skills_result.stderr}'
-            }
+        try:
+            # One job for both updaters; the budget is the sum of their 5-minute timeouts
+            skills_result, summary_result = run_stage(run_updater_stages, 300 + 300,
+                                                      jd_skills=jd_skills, artifacts_dir=artifacts_dir)
+        except SystemExit as e:
+            return {'success': False, 'error': str(e)}
 
-        print("✅ Skills updater completed successfully")
-        
-        # Step 2: Use subprocess to run summary-updater
-        print("🔧 Running summary-updater.py...")
-        summary_result = subprocess.run([
-            sys.executable, 'summary-updater.py'
-        ], capture_output=True, text=True, timeout=300)
-        
-        print(f"Summary-updater exit code: {summary_result.returncode}")
-        if summary_result.stdout:
-            print(f"Summary-updater stdout: {summary_result.stdout}")
-        if summary_result.stderr:
-            print(f"Summary-updater stderr: {summary_result.stderr}")
-
-        if summary_result.returncode != 0:
-            return {
-                'success': False,
-                'error': f'Summary updater failed with exit code {summary_result.returncode}: {summary_result.stderr}'
-            }
-
-        print("✅ Summary updater completed successfully")
+        # Check if the required artifacts were created (one directory scan
+        # instead of a stat per file)
+        present = {entry.name for entry in os.scandir(artifacts_dir) if entry.is_file()}
 
-        # Check if the required artifacts were created
-        artifacts_dir = Path('artifacts')
-        skills_updated_block = artifacts_dir / 'skills_updated_block.tex'
-        skills_editor_output = artifacts_dir / 'skills_editor_output.json'
-        summary_updated_block = artifacts_dir / 'summary_updated_block.tex'
-        summary_editor_output = artifacts_dir / 'summary_editor_output.json'
-
-        if not skills_updated_block.exists():
+        if 'skills_updated_block.tex' not in present:
             return {
                 'success': False,
                 'error': 'Skills updater did not generate required artifacts'
             }
             
-        if not summary_updated_block.exists():
+        if 'summary_updated_block.tex' not in present:
             return {
                 'success': False,
                 'error': 'Summary updater did not generate required artifacts'
             }
         
-        # Parse changes from skills and summary editor outputs
-        changes = parse_all_changes(temp_dir)
+        # Parse changes from what the updaters returned, rather than reading
+        # back the artifacts they just wrote
+        jd_skills_path = Path(jd_skills)
+        changes = parse_all_changes({
+            'skills_editor_output': skills_result['editor_output'],
+            'skills_updated_block': skills_result['updated_block'],
+            'summary_editor_output': summary_result,
+            'jd_skills': load_skills_json(jd_skills_path) if jd_skills_path.exists() else None,
+        })
         
         result_data = {
             'success': True,
-            'files': [
-                'artifacts/jd_skills.json', 
-                'artifacts/skills_updated_block.tex', 
-                'artifacts/skills_editor_output.json',
-                'artifacts/summary_updated_block.tex',
-                'artifacts/summary_editor_output.json', 
-                'skills.tex', 
-                'Resume/Conner_Jordan_Software_Engineer.tex'
-            ]
+            'files': session_result_files(present)
         }
         
         if changes:
@@ -1227,60 +1763,120 @@ def run_resume_update(temp_dir: str) -> Dict[str, Any]:
             
         return result_data
 
-    except subprocess.TimeoutExpired:
-        return {'success': False, 'error': 'Resume updater timed out after 5 minutes'}
+    except FuturesTimeoutError:
+        return {'success': False, 'error': 'Resume updater timed out after 10 minutes'}
     except Exception as e:
         return {'success': False, 'error': f'Resume update failed: {str(e)}'}
 
 
+def run_updater_stages(jd_skills: str, artifacts_dir: Path) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Run skills-updater then summary-updater under resume_lock and snapshot the
+    resume they produced into the session dir; returns both updaters' results
+    """
+    # Taken here on the worker rather than around run_stage, so the lock is
+    # held for as long as the updaters actually run, even past a timeout
+    with resume_lock:
+        logger.info("🔧 Running skills-updater...")
+        try:
+            skills_result = skills_updater.run(extractor_output=jd_skills, artifacts_dir=str(artifacts_dir))
+        except SystemExit as e:
+            raise SystemExit(f'Skills updater failed: {e}')
+        logger.info("✅ Skills updater completed successfully")
+
+        logger.info("🔧 Running summary-updater...")
+        try:
+            summary_result = summary_updater.run(jd_skills=jd_skills, artifacts_dir=str(artifacts_dir))
+        except SystemExit as e:
+            raise SystemExit(f'Summary updater failed: {e}')
+        logger.info("✅ Summary updater completed successfully")
+
+        # The after-PDF is compiled from this copy, outside the lock, so it
+        # shows this update even if another one rewrites the resume first
+        if RESUME_TEX.exists():
+            fast_copy(RESUME_TEX, artifacts_dir.parent / RESUME_TEX.name)
+    return skills_result, summary_result
+
+
+def run_pipeline_stages(job_description: str, artifacts_dir: Path) -> None:
+    """Run jd-parser, skills-updater and summary-updater back to back"""
+    jd_parser.run(jd_text=job_description, artifacts_dir=str(artifacts_dir))
+    jd_skills = str(artifacts_dir / 'jd_skills.json')
+    # The updaters rewrite the shared resume files, so serialize them with
+    # /update-resume. Taken here on the worker rather than around run_stage,
+    # so the lock is held for as long as they actually run, even past a timeout
+    with resume_lock:
+        skills_updater.run(extractor_output=jd_skills, artifacts_dir=str(artifacts_dir))
+        summary_updater.run(jd_skills=jd_skills, artifacts_dir=str(artifacts_dir))
+
+
 def run_pipeline(jd_file_path: str, temp_dir: str) -> Dict[str, Any]:
     """Run the complete pipeline (for backward compatibility)"""
-    # First run JD parsing
-    jd_result = run_jd_parsing(jd_file_path, temp_dir)
-    if not jd_result['success']:
-        return jd_result
+    artifacts_dir = session_artifacts_dir(temp_dir)
+    try:
+        # One submission for the whole chain instead of one per stage;
+        # the budget is the sum of the per-stage timeouts
+        logger.info("🔧 Running full pipeline...")
+        run_stage(run_pipeline_stages, 1800 + 300 + 300,
+                  job_description=Path(jd_file_path).read_text(encoding='utf-8'),
+                  artifacts_dir=artifacts_dir)
+    except FuturesTimeoutError:
+        return {'success': False, 'error': 'Pipeline timed out after 40 minutes'}
+    except SystemExit as e:
+        return {'success': False, 'error': f'Pipeline failed: {e}'}
+    except Exception as e:
+        return {'success': False, 'error': f'Pipeline failed: {str(e)}'}
 
-    # Then run resume update
-    update_result = run_resume_update(temp_dir)
-    if not update_result['success']:
-        return update_result
+    present = {entry.name for entry in os.scandir(artifacts_dir) if entry.is_file()}
+    skills_data = load_skills_json(artifacts_dir / 'jd_skills.json')
 
-    # Combine results
     return {
         'success': True,
-        'skills_count': jd_result['skills_count'],
-        'files': update_result['files']
+        'skills_count': len(skills_data.get('skills_flat', [])),
+        'files': session_result_files(present)
     }
 
 
 @app.route('/reset-baseline', methods=['POST'])
 def reset_baseline():
     """Reset the baseline backup to current resume state"""
+    global baseline_verified_mtime
     try:
-        # Remove existing baseline backup
-        baseline_dir = Path('baseline_backup')
-        if baseline_dir.exists():
-            shutil.rmtree(baseline_dir)
-            print("🗑️ Removed existing baseline backup")
-        
-        # Create new baseline backup
-        success = ensure_baseline_backup()
+        # Build the new baseline alongside the old one and only swap it in once
+        # complete, so a failed rebuild leaves the previous baseline in place
+        with baseline_lock:
+            staging_dir = staging_baseline_dir()
+            success = build_baseline(staging_dir)
+            if success:
+                install_baseline(staging_dir)
+                logger.info("🗑️ Replaced existing baseline backup")
+                baseline_verified_mtime = baseline_dir_mtime()
+            else:
+                shutil.rmtree(staging_dir, ignore_errors=True)
         
         if success:
-            return jsonify({'success': True, 'message': 'Baseline backup reset successfully'})
+            return json_response({'success': True, 'message': 'Baseline backup reset successfully'})
         else:
-            return jsonify({'success': False, 'error': 'Failed to create new baseline backup'}), 500
+            return json_response({'success': False, 'error': 'Failed to create new baseline backup'}, 500)
             
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return json_response({'success': False, 'error': str(e)}, 500)
 
 if __name__ == '__main__':
-    print("🚀 Starting JD Parser Web UI...")
-    print("📝 Open http://localhost:8081 in your browser")
-    print("💡 Make sure LM Studio is running with qwen2.5-32b-instruct model")
+    logger.info("🚀 Starting JD Parser Web UI...")
+    logger.info("📝 Open http://localhost:8081 in your browser")
+    logger.info("💡 Make sure LM Studio is running with qwen2.5-32b-instruct model")
     
     # Ensure baseline backup exists on startup
-    print("\n🔧 Checking baseline backup...")
+    logger.info("🔧 Checking baseline backup...")
     ensure_baseline_backup()
     
-    app.run(debug=False, host='127.0.0.1', port=8081, use_reloader=False)
+    # Serve with waitress' thread pool when available so quick requests
+    # aren't stuck behind a long-running pipeline request
+    try:
+        from waitress import serve
+    except ImportError:
+        logger.warning("⚠️  waitress not installed, falling back to the Flask dev server")
+        app.run(debug=False, host='127.0.0.1', port=8081, use_reloader=False, threaded=True)
+    else:
+        serve(app, host='127.0.0.1', port=8081, threads=16)
@@ -10,14 +10,22 @@ and writes artifacts/jd_skills.json.
 """
 
 import argparse
+import atexit
+import glob
+import heapq
 import json
+import os
 import re
 import sys
+import threading
 import unicodedata
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import aiohttp
 import asyncio
+import orjson
 
 # -------------------
 # Config
@@ -27,6 +35,20 @@ DEFAULT_BASE_URL = "http://127.0.0.1:1234/v1"
 DEFAULT_API_KEY = "lm-studio"
 DEFAULT_MODEL = "qwen2.5-32b-instruct"       # swap to the model you loaded
 TIMEOUT_S = 1800  # 30 minutes - let it take as long as needed
+CONNECTION_LIMIT = 10
+# JDs extracted concurrently by --jd-glob; they all share one session
+BATCH_CONCURRENCY = 8
+
+# One event loop (on a background thread) and one aiohttp session for the
+# life of the process, so the web UI keeps its keep-alive connection to
+# LM Studio between runs instead of reconnecting every time
+LOOP: Optional[asyncio.AbstractEventLoop] = None
+LOOP_THREAD: Optional[threading.Thread] = None
+HTTP_SESSION: Optional[aiohttp.ClientSession] = None
+loop_lock = threading.Lock()
+# Background reads of streamed replies chat_once returned early from (see
+# drain_response); held here so the tasks aren't garbage collected mid-run
+drain_tasks = set()
 
 GEN_OPTIONS = {
     "temperature": 0.0,
@@ -47,10 +69,6 @@ SUBSECTIONS = [
     "Databases",
 ]
 
-# -------------------
-# SYSTEM PROMPT — JD → Skills Extractor (your WebUI version, verbatim)
-# -------------------
-JD_EXTRACTOR_SYSTEM = """
 # -------------------
 # SYSTEM PROMPT — JD → Skills Extractor (your WebUI version, verbatim)
 # -------------------
@@ -160,22 +178,49 @@ Forbidden behavior
 
 Validation
 - Every extracted item MUST include at least one evidence snippet that appears verbatim (case-insensitive) in the JD.
-"""
 """.strip()
 
+# Normalized skill -> canonical form, for the unambiguous aliases listed in
+# the prompt (context-dependent ones like "ir" or "crypto" are left to the LLM)
+CANONICAL_FIXES = {
+    "seim": "SIEM",
+    "siem": "SIEM",
+    "sso": "SSO",
+    "single sign on": "SSO",
+    "single sign-on": "SSO",
+    "single-sign-on": "SSO",
+    "oauth2": "OAuth 2.0",
+    "oauth 2.0": "OAuth 2.0",
+    "oidc": "OpenID Connect (OIDC)",
+    "mfa": "MFA",
+    "2fa": "MFA",
+    "edr": "EDR",
+}
+
 # -------------------
 # Helpers
 # -------------------
 
 
-def norm(s: str) -> str:
+class JDParseError(ValueError):
+    """The extractor's reply could not be turned into a skills payload."""
+
+
+def normalize_text(s: str) -> str:
     return unicodedata.normalize("NFKC", s).strip().lower()
 
 
-def evidence_occurs(evidence_list, jd_text):
-    jdn = norm(jd_text)
+@lru_cache(maxsize=4096)
+def norm(s: str) -> str:
+    """normalize_text, memoized for the short skill/evidence strings that repeat."""
+    return normalize_text(s)
+
+
+def evidence_occurs(evidence_list, jd_norm):
+    """True if any evidence snippet occurs in the JD; `jd_norm` is the normalized JD."""
     for ev in evidence_list or []:
-        if norm(ev) and norm(ev) in jdn:
+        ev_norm = norm(ev)
+        if ev_norm and ev_norm in jd_norm:
             return True
     return False
 
@@ -184,18 +229,23 @@ def sanitize_ranked(ranked: List[Dict[str, Any]], jd_text: str) -> List[Dict[str
     """Deduplicate by canonical form, require evidence, fix common typos."""
     seen = set()
     out = []
+    # Normalize the JD once rather than once per ranked item (uncached: it's
+    # large and only seen once)
+    jd_norm = normalize_text(jd_text)
     for item in ranked or []:
         token = item.get("token", "")
         canon = item.get("canonical") or token
         key = norm(canon)
+        # Map known typos/aliases to their canonical form before deduping, so
+        # e.g. "2FA" and "MFA" collapse into one entry
+        if key in CANONICAL_FIXES:
+            canon = CANONICAL_FIXES[key]
+            key = norm(canon)
         if not key or key in seen:
             continue
-        if not evidence_occurs(item.get("evidence", []), jd_text):
+        if not evidence_occurs(item.get("evidence", []), jd_norm):
             continue
-        # normalize a couple of common typos
-        if key == "seim":
-            canon = "SIEM"
-        seen.add(norm(canon))
+        seen.add(key)
         out.append({
             "token": token,
             "canonical": canon,
@@ -208,10 +258,85 @@ def sanitize_ranked(ranked: List[Dict[str, Any]], jd_text: str) -> List[Dict[str
 
 
 def cap_to_n_skills(ranked: List[Dict[str, Any]], n: int = 10) -> List[Dict[str, Any]]:
-    """Sort by confidence (desc) then truncate to N."""
-    ranked_sorted = sorted(ranked, key=lambda x: x.get(
-        "confidence", 0), reverse=True)
-    return ranked_sorted[:n]
+    """Top N by confidence (desc); same result as sorting then truncating."""
+    # sanitize_ranked always sets "confidence", so itemgetter is safe here
+    return heapq.nlargest(n, ranked, key=itemgetter("confidence"))
+
+
+def event_loop() -> asyncio.AbstractEventLoop:
+    """
+    The shared background event loop, started on first use and restarted
+    (with a fresh session) if its thread has died
+    """
+    global LOOP, LOOP_THREAD, HTTP_SESSION
+    with loop_lock:
+        if LOOP_THREAD is None or not LOOP_THREAD.is_alive():
+            if LOOP_THREAD is None:
+                atexit.register(close_http_session)
+            # A session belongs to the loop it was created on
+            HTTP_SESSION = None
+            LOOP = asyncio.new_event_loop()
+            LOOP_THREAD = threading.Thread(target=LOOP.run_forever, name="jd-parser-loop", daemon=True)
+            LOOP_THREAD.start()
+    return LOOP
+
+
+def http_session() -> aiohttp.ClientSession:
+    """The shared aiohttp session; only call from coroutines running on event_loop()"""
+    global HTTP_SESSION
+    if HTTP_SESSION is None or HTTP_SESSION.closed:
+        HTTP_SESSION = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=TIMEOUT_S),
+            connector=aiohttp.TCPConnector(limit=CONNECTION_LIMIT))
+    return HTTP_SESSION
+
+
+def close_http_session() -> None:
+    """Close the shared session at exit so aiohttp doesn't warn about it"""
+    if HTTP_SESSION is not None and not HTTP_SESSION.closed and LOOP_THREAD.is_alive():
+        asyncio.run_coroutine_threadsafe(HTTP_SESSION.close(), LOOP).result(timeout=5)
+
+
+async def read_streamed_content(r: aiohttp.ClientResponse) -> str:
+    """
+    Collect the content deltas of a streamed (SSE) chat completion.
+
+    Returns as soon as the accumulated text holds one complete top-level
+    JSON object, so trailing tokens after the answer are never waited on.
+    """
+    parts: List[str] = []
+    async for line in r.content:
+        if not line.startswith(b"data:"):
+            continue
+        data = line[5:].strip()
+        if data == b"[DONE]":
+            break
+        delta = orjson.loads(data)["choices"][0].get("delta", {}).get("content")
+        if not delta:
+            continue
+        parts.append(delta)
+        # The outer object can only close on a "}"; only then is it worth
+        # trying to decode what we have so far
+        if "}" in delta:
+            text = "".join(parts)
+            start = text.find("{")
+            if start != -1:
+                try:
+                    JSON_DECODER.raw_decode(text, start)
+                    return text
+                except json.JSONDecodeError:
+                    pass
+    return "".join(parts)
+
+
+async def drain_response(r: aiohttp.ClientResponse) -> None:
+    """Read out the rest of a response we no longer need, then release it for reuse"""
+    try:
+        await r.content.read()
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        pass
+    finally:
+        r.release()
 
 
 async def chat_once(base_url: str, api_key: str, model: str,
@@ -225,17 +350,32 @@ async def chat_once(base_url: str, api_key: str, model: str,
         "seed": options.get("seed", 42),
         "max_tokens": options.get("max_tokens", 4096),
         "stop": options.get("stop", []),
-        "stream": False  # Disable streaming to avoid parsing issues
+        "stream": True
     }
-    timeout = aiohttp.ClientTimeout(total=TIMEOUT_S)
-
     try:
-        async with aiohttp.ClientSession(timeout=timeout) as sess:
-            async with sess.post(url, headers={"Authorization": f"Bearer {api_key}"},
-                                 json=payload) as r:
-                r.raise_for_status()
-                response = await r.json()
+        sess = http_session()
+        r = await sess.post(url, headers={"Authorization": f"Bearer {api_key}"},
+                            json=payload)
+        drain = False
+        try:
+            r.raise_for_status()
+            # Servers that ignore "stream" answer with a plain JSON body
+            if r.content_type != "text/event-stream":
+                response = await r.json(loads=orjson.loads)
                 return response['choices'][0]['message']['content']
+            text = await read_streamed_content(r)
+            drain = not r.content.at_eof()
+            return text
+        finally:
+            if drain:
+                # Releasing a half-read response would close its connection;
+                # read out the tail in the background instead, so the answer
+                # returns now and the connection still goes back to the pool
+                task = asyncio.get_running_loop().create_task(drain_response(r))
+                drain_tasks.add(task)
+                task.add_done_callback(drain_tasks.discard)
+            else:
+                r.release()
     except Exception as e:
         print(f"LLM call failed: {e}", file=sys.stderr)
         # Fallback to existing output if available
@@ -250,60 +390,51 @@ async def chat_once(base_url: str, api_key: str, model: str,
         raise e
 
 
+# Cleanup patterns applied to every LLM reply in coerce_json, compiled once
+FENCE_OPEN_PATTERN = re.compile(r'^```json\s*')
+FENCE_CLOSE_PATTERN = re.compile(r'```\s*$')
+ESCAPED_AMP_PATTERN = re.compile(r'\\&')
+DOUBLE_ESCAPE_PATTERN = re.compile(r'\\\\([^"\\])')
+JSON_DECODER = json.JSONDecoder()
+
+
 def coerce_json(s: str) -> Any:
     """Parse JSON with basic error recovery for common LLM output issues."""
-    # Strip common code fences
-    s = re.sub(r'^```json\s*', '', s.strip())
-    s = re.sub(r'```\s*$', '', s.strip())
-
-    # Fix common escape sequence issues
-    s = re.sub(r'\\&', '&', s)  # Fix escaped ampersands
-    s = re.sub(r'\\\\([^"\\])', r'\\\1', s)  # Fix double-escaped characters
+    s = s.strip()
 
-    # First attempt: direct parse
+    # Fast path: clean JSON (the usual case at temperature 0) parses as-is,
+    # with none of the cleanup passes below (orjson's error subclasses json's)
     try:
-        return json.loads(s)
+        return orjson.loads(s)
     except json.JSONDecodeError:
         pass
 
-    # Second attempt: find the first complete JSON object
-    # Look for opening brace and try to find balanced closing
-    brace_count = 0
-    in_string = False
-    escape_next = False
-    start_pos = -1
-    end_pos = -1
-
-    for i, char in enumerate(s):
-        if escape_next:
-            escape_next = False
-            continue
+    # Strip common code fences (s is already stripped, and removing the
+    # opening fence can't leave trailing whitespace for the closing one)
+    s = FENCE_OPEN_PATTERN.sub('', s)
+    s = FENCE_CLOSE_PATTERN.sub('', s)
 
-        if char == '\\':
-            escape_next = True
-            continue
+    # Fix common escape sequence issues
+    s = ESCAPED_AMP_PATTERN.sub('&', s)  # Fix escaped ampersands
+    s = DOUBLE_ESCAPE_PATTERN.sub(r'\\\1', s)  # Fix double-escaped characters
 
-        if char == '"' and not escape_next:
-            in_string = not in_string
-            continue
+    # Second attempt: direct parse of the cleaned-up text
+    try:
+        return orjson.loads(s)
+    except json.JSONDecodeError:
+        pass
 
-        if not in_string:
-            if char == '{':
-                if brace_count == 0:
-                    start_pos = i
-                brace_count += 1
-            elif char == '}':
-                brace_count -= 1
-                if brace_count == 0 and start_pos != -1:
-                    end_pos = i + 1
-                    break
-
-    if start_pos != -1 and end_pos != -1:
-        candidate = s[start_pos:end_pos]
+    # Last attempt: take the first complete object, decoding from each
+    # top-level "{" in turn (str.find and raw_decode both run in C). After a
+    # failure, resume past the error so objects nested inside the broken one
+    # are never mistaken for the answer.
+    start = s.find('{')
+    while start != -1:
         try:
-            return json.loads(candidate)
-        except json.JSONDecodeError:
-            pass
+            obj, _ = JSON_DECODER.raw_decode(s, start)
+            return obj
+        except json.JSONDecodeError as e:
+            start = s.find('{', max(e.pos, start + 1))
 
     # If nothing worked, raise original error
     raise json.JSONDecodeError(f"Could not parse JSON from response", s, 0)
@@ -313,23 +444,12 @@ def coerce_json(s: str) -> Any:
 # -------------------
 
 
-async def main():
-    ap = argparse.ArgumentParser()
-    ap.add_argument("--jd", default="jd.txt", help="Path to JD text")
-    ap.add_argument("--base-url", default=DEFAULT_BASE_URL)
-    ap.add_argument("--api-key", default=DEFAULT_API_KEY)
-    ap.add_argument("--model", default=DEFAULT_MODEL)
-    ap.add_argument("--cap", type=int, default=10,
-                    help="Max skills to return in the flat list")
-    args = ap.parse_args()
-
-    jd_path = Path(args.jd)
-    if not jd_path.exists():
-        sys.exit(f"ERROR: JD file not found: {jd_path}")
-    jd_text = jd_path.read_text(encoding="utf-8").strip()
-
+async def extract_skills(jd_text: str, base_url: str = DEFAULT_BASE_URL,
+                         api_key: str = DEFAULT_API_KEY, model: str = DEFAULT_MODEL,
+                         cap: int = 10) -> Dict[str, Any]:
+    """Run the extractor against the LLM and return the cleaned skills payload."""
     resp = await chat_once(
-        args.base_url, args.api_key, args.model,
+        base_url, api_key, model,
         [
             {"role": "system", "content": JD_EXTRACTOR_SYSTEM},
             {"role": "user", "content": jd_text},
@@ -343,7 +463,9 @@ async def main():
         with open("llm_output.txt", "w") as f:
             f.write(resp)
         print("Wrote raw LLM output to llm_output.txt", file=sys.stderr)
-        sys.exit(f"ERROR: extractor did not return valid JSON: {e}")
+        # Not sys.exit: SystemExit would escape the shared loop's run_forever
+        # and kill it; main() turns this into the exit for the CLI
+        raise JDParseError(f"extractor did not return valid JSON: {e}") from e
 
     # Sanitize ranked list
     ranked = sanitize_ranked(raw.get("job_skills_ranked", []), jd_text)
@@ -365,27 +487,119 @@ async def main():
         by_section[sec] = canon_vals[:3]
 
     # Build a flat list of up to N skills (canonical strings) sorted by confidence
-    top_n = cap_to_n_skills(ranked, n=args.cap)
+    top_n = cap_to_n_skills(ranked, n=cap)
     flat = [s["canonical"] for s in top_n]
 
-    out = {
+    return {
         "job_skills_ranked": ranked,   # cleaned, de-duped, evidence-checked
         "by_section_top3": by_section,  # trimmed to ≤3 each
         # <= N (default 10) — feed this to the editor
         "skills_flat": flat
     }
 
+
+def run(jd: str = "jd.txt", base_url: str = DEFAULT_BASE_URL,
+        api_key: str = DEFAULT_API_KEY, model: str = DEFAULT_MODEL,
+        cap: int = 10, artifacts_dir: str = "artifacts",
+        jd_text: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Extract skills from the JD and write <artifacts_dir>/jd_skills.json.
+
+    The JD comes from `jd_text` when given, otherwise from the file at `jd`
+    ("-" reads stdin). Importable entry point used by the web UI; returns
+    the written payload.
+    """
+    if jd_text is None:
+        if jd == "-":
+            jd_text = sys.stdin.read()
+        else:
+            jd_path = Path(jd)
+            if not jd_path.exists():
+                sys.exit(f"ERROR: JD file not found: {jd_path}")
+            jd_text = jd_path.read_text(encoding="utf-8")
+    jd_text = jd_text.strip()
+
+    out = asyncio.run_coroutine_threadsafe(
+        extract_skills(jd_text, base_url, api_key, model, cap), event_loop()).result()
+    write_skills(out, artifacts_dir)
+    return out
+
+
+async def extract_many(jd_texts: List[str], base_url: str = DEFAULT_BASE_URL,
+                       api_key: str = DEFAULT_API_KEY, model: str = DEFAULT_MODEL,
+                       cap: int = 10) -> List[Dict[str, Any]]:
+    """extract_skills for several JDs at once, at most BATCH_CONCURRENCY in flight."""
+    sem = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async def guarded(jd_text: str) -> Dict[str, Any]:
+        async with sem:
+            return await extract_skills(jd_text, base_url, api_key, model, cap)
+
+    return await asyncio.gather(*(guarded(t) for t in jd_texts))
+
+
+def run_many(jd_glob: str, base_url: str = DEFAULT_BASE_URL,
+             api_key: str = DEFAULT_API_KEY, model: str = DEFAULT_MODEL,
+             cap: int = 10, artifacts_dir: str = "artifacts") -> Dict[str, Any]:
+    """
+    Extract skills from every JD file matching `jd_glob`, concurrently.
+
+    Each result is written to <artifacts_dir>/<jd file stem>/jd_skills.json;
+    returns the payloads keyed by JD path.
+    """
+    jd_paths = sorted(glob.glob(jd_glob))
+    if not jd_paths:
+        sys.exit(f"ERROR: no JD files match: {jd_glob}")
+    jd_texts = [Path(p).read_text(encoding="utf-8").strip() for p in jd_paths]
+
+    outs = asyncio.run_coroutine_threadsafe(
+        extract_many(jd_texts, base_url, api_key, model, cap), event_loop()).result()
+    for jd_path, out in zip(jd_paths, outs):
+        write_skills(out, Path(artifacts_dir) / Path(jd_path).stem)
+    return dict(zip(jd_paths, outs))
+
+
+def write_skills(out: Dict[str, Any], artifacts_dir) -> Path:
+    """Write <artifacts_dir>/jd_skills.json and return its path."""
     # Ensure artifacts directory exists
-    artifacts_dir = Path("artifacts")
-    artifacts_dir.mkdir(exist_ok=True)
+    artifacts_dir = Path(artifacts_dir)
+    artifacts_dir.mkdir(parents=True, exist_ok=True)
 
-    # Write to artifacts/jd_skills.json
+    # Write via a temp file so concurrent readers never see a half-written document
     output_path = artifacts_dir / "jd_skills.json"
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(out, f, ensure_ascii=False, indent=2)
+    tmp_path = output_path.with_suffix(".json.tmp")
+    tmp_path.write_bytes(orjson.dumps(out, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_path, output_path)
 
     print(f"✅ Wrote output to: {output_path}", file=sys.stderr)
-    print(json.dumps(out, ensure_ascii=False, indent=2))
+    return output_path
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--jd", default="jd.txt", help="Path to JD text (- for stdin)")
+    ap.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    ap.add_argument("--api-key", default=DEFAULT_API_KEY)
+    ap.add_argument("--model", default=DEFAULT_MODEL)
+    ap.add_argument("--cap", type=int, default=10,
+                    help="Max skills to return in the flat list")
+    ap.add_argument("--artifacts-dir", default="artifacts",
+                    help="Directory to write jd_skills.json into")
+    ap.add_argument("--jd-glob",
+                    help="Process every JD file matching this glob concurrently "
+                         "(results go to <artifacts-dir>/<jd stem>/jd_skills.json)")
+    args = vars(ap.parse_args())
+
+    jd_glob = args.pop("jd_glob")
+    try:
+        if jd_glob:
+            args.pop("jd")
+            out = run_many(jd_glob, **args)
+        else:
+            out = run(**args)
+    except JDParseError as e:
+        sys.exit(f"ERROR: {e}")
+    print(orjson.dumps(out, option=orjson.OPT_INDENT_2).decode())
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Two-tier cache for JD -> extracted skills
+
+1. Exact match: byte-identical JDs (refreshes, re-clicks) hit an LRU keyed by
+   a blake2b digest of the text.
+2. Semantic: near-duplicates (re-posted listings, minor edits) extract to the
+   same skills, so an embedding-similarity hit also skips the LLM call. This
+   tier needs the optional sentence-transformers package and is skipped
+   without it.
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    np = None
+    SentenceTransformer = None
+
+EMBEDDING_MODEL = 'sentence-transformers/all-MiniLM-L6-v2'
+SIMILARITY_THRESHOLD = 0.95
+MAX_ENTRIES = 512
+MAX_EXACT_ENTRIES = 256
+
+logger = logging.getLogger(__name__)
+
+model = None
+# Loading the model can take seconds (or a download), so it has its own lock
+# and never holds up exact-tier lookups and stores, which use cache_lock
+model_lock = threading.Lock()
+cache_lock = threading.Lock()
+
+# Exact tier: digest of the JD text -> skills, oldest first (LRU order)
+exact_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+
+# Row i of embedding_matrix is the (L2-normalized) embedding of the JD that
+# produced cached_skills[i]; hit_counts[i] drives LFU eviction. The matrix is
+# a contiguous float32 block preallocated to MAX_ENTRIES rows, so a lookup is
+# a single BLAS matrix-vector product over the first len(cached_skills) rows
+embedding_matrix = None
+cached_skills: List[Dict[str, Any]] = []
+hit_counts: List[int] = []
+
+
+def embed_jd(jd_text: str):
+    """Embed a JD as a unit vector, loading the model on first use"""
+    global model
+    with model_lock:
+        if model is None:
+            logger.info(f"🧠 Loading embedding model {EMBEDDING_MODEL}...")
+            model = SentenceTransformer(EMBEDDING_MODEL)
+    return model.encode(jd_text, normalize_embeddings=True)
+
+
+def lookup(jd_text: str) -> Tuple[Optional[Dict[str, Any]], Any]:
+    """
+    Find cached skills for `jd_text`, exact match first, then a similar JD
+    
+    Returns:
+        Tuple of (cached skills data or None, key to pass to store() on a miss)
+    """
+    digest = hashlib.blake2b(jd_text.encode('utf-8'), digest_size=16).digest()
+    with cache_lock:
+        if digest in exact_cache:
+            exact_cache.move_to_end(digest)
+            return exact_cache[digest], None
+
+    if SentenceTransformer is None:
+        return None, (digest, None)
+
+    embedding = np.ascontiguousarray(embed_jd(jd_text), dtype=np.float32)
+    with cache_lock:
+        if cached_skills:
+            # Rows and query are unit vectors, so the dot product is cosine similarity
+            similarities = embedding_matrix[:len(cached_skills)] @ embedding
+            best = int(similarities.argmax())
+            if similarities[best] >= SIMILARITY_THRESHOLD:
+                hit_counts[best] += 1
+                # Remember the hit under this JD's digest too, so a repeat of
+                # the same near-duplicate skips the embedding next time
+                remember_exact(digest, cached_skills[best])
+                return cached_skills[best], None
+    return None, (digest, embedding)
+
+
+def remember_exact(digest: bytes, skills_data: Dict[str, Any]) -> None:
+    """Add an exact-tier entry, evicting the least recently used; call with cache_lock held"""
+    exact_cache[digest] = skills_data
+    exact_cache.move_to_end(digest)
+    if len(exact_cache) > MAX_EXACT_ENTRIES:
+        exact_cache.popitem(last=False)
+
+
+def store(key: Any, skills_data: Dict[str, Any]) -> None:
+    """Remember the skills extracted for the JD that lookup() returned `key` for"""
+    global embedding_matrix
+    if key is None:
+        return
+    digest, embedding = key
+
+    with cache_lock:
+        remember_exact(digest, skills_data)
+
+        if embedding is None:
+            return
+
+        if embedding_matrix is None:
+            embedding_matrix = np.zeros((MAX_ENTRIES, embedding.shape[0]), dtype=np.float32)
+
+        if len(cached_skills) < MAX_ENTRIES:
+            row = len(cached_skills)
+            cached_skills.append(skills_data)
+            hit_counts.append(0)
+        else:
+            # Full: overwrite the least frequently hit entry in place
+            row = hit_counts.index(min(hit_counts))
+            cached_skills[row] = skills_data
+            hit_counts[row] = 0
+        embedding_matrix[row] = embedding
@@ -3,13 +3,40 @@
 PDF utilities for LaTeX resume compilation and management
 """
 
+import hashlib
 import subprocess
+from collections import deque
 import shutil
 import tempfile
+import threading
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 import os
 
+# Compiled PDFs keyed by a hash of their TeX source. pdflatex is the slowest
+# step in the pipeline, so an unchanged source is only ever compiled once.
+PDF_CACHE_DIR = Path('.cache/pdf')
+# Compiled PDFs kept; hits refresh an entry's mtime, so the oldest-mtime
+# entries are the least recently used and are pruned first
+PDF_CACHE_MAX_ENTRIES = 64
+
+# Lines of the pdflatex log shown when a compile fails
+LATEX_LOG_TAIL_LINES = 40
+
+# tectonic is a single self-contained engine that starts much faster than
+# pdflatex (no format loading per run). It is XeTeX-based, so pdfTeX-only
+# primitives (e.g. the resume's \pdfgentounicode) fail under it: only use it
+# when opted in with USE_TECTONIC=1 for a resume that compiles with it
+TECTONIC = shutil.which('tectonic') if os.getenv('USE_TECTONIC') == '1' else None
+LATEX_ENGINE = 'tectonic' if TECTONIC else 'pdflatex'
+
+def latex_command(tex_name: str) -> List[str]:
+    """Command line compiling `tex_name` to a PDF in the working directory"""
+    if TECTONIC:
+        # --keep-logs leaves a .log behind so failures are reported the same way
+        return [TECTONIC, '--keep-logs', '--chatter', 'minimal', '--outdir', '.', tex_name]
+    return ['pdflatex', '-interaction=batchmode', tex_name]
+
 def compile_latex_to_pdf(tex_file_path: str, output_dir: Optional[str] = None) -> Optional[str]:
     """
     Compile a LaTeX file to PDF using pdflatex
@@ -39,36 +66,115 @@ def compile_latex_to_pdf(tex_file_path: str, output_dir: Optional[str] = None) -
     # Expected PDF output path
     pdf_name = tex_path.stem + '.pdf'
     pdf_path = output_dir / pdf_name
+
+    # Reuse a previous compile of identical source by the same engine if we
+    # have one (engines' output differs, so a before/after pair never mixes them)
+    # BLAKE2b: faster than SHA-256 in software and just as collision-resistant
+    # The source is read once: the same bytes are hashed and, on a miss,
+    # written out for pdflatex instead of copying the file a second time
+    tex_source = tex_path.read_bytes()
+    source_hash = hashlib.blake2b(tex_source, digest_size=32,
+                                  person=LATEX_ENGINE.encode()).hexdigest()
+    cached_pdf = PDF_CACHE_DIR / f'{source_hash}.pdf'
+    try:
+        fast_copy(cached_pdf, pdf_path)
+        os.utime(cached_pdf)
+        print(f"✅ PDF reused from compile cache: {pdf_path}")
+        return str(pdf_path)
+    except FileNotFoundError:
+        pass
     
     try:
         # Create a temporary copy in output directory to avoid permission issues
         temp_tex_path = output_dir / tex_path.name
-        shutil.copy2(tex_path, temp_tex_path)
+        temp_tex_path.write_bytes(tex_source)
         
-        # Run pdflatex with minimal output
-        result = subprocess.run([
-            'pdflatex',
-            '-interaction=nonstopmode',
-            str(temp_tex_path.name)
-        ], 
-        capture_output=True, 
-        text=True,
-        cwd=str(output_dir)
-        )
+        # Run the engine quietly: the transcript goes to the .log file only,
+        # so nothing is piped back and decoded unless the compile fails
+        returncode = subprocess.run(
+            latex_command(temp_tex_path.name),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            cwd=str(output_dir)
+        ).returncode
         
-        if result.returncode == 0 and pdf_path.exists():
+        if returncode == 0 and pdf_path.exists():
             print(f"✅ PDF compiled successfully: {pdf_path}")
+            PDF_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Copy under a temp name and rename into place, so a concurrent
+            # or later lookup never copies out a half-written PDF
+            tmp_pdf = cached_pdf.with_name(f'{cached_pdf.name}.tmp.{os.getpid()}.{threading.get_ident()}')
+            fast_copy(pdf_path, tmp_pdf)
+            os.replace(tmp_pdf, cached_pdf)
+            prune_pdf_cache()
             return str(pdf_path)
         else:
-            print(f"❌ LaTeX compilation failed:")
-            print(f"STDOUT: {result.stdout}")
-            print(f"STDERR: {result.stderr}")
+            log_path = output_dir / (tex_path.stem + '.log')
+            log_tail = deque(maxlen=LATEX_LOG_TAIL_LINES)
+            if log_path.exists():
+                with open(log_path, encoding='utf-8', errors='replace') as log:
+                    log_tail.extend(log)
+            print(f"❌ LaTeX compilation failed (last {len(log_tail)} lines of {log_path.name}):")
+            print(''.join(log_tail))
             return None
             
     except Exception as e:
         print(f"❌ Error running pdflatex: {e}")
         return None
 
+def prune_pdf_cache() -> None:
+    """
+    Drop least recently used PDFs beyond PDF_CACHE_MAX_ENTRIES. Only runs
+    after a real compile, so cache hits never pay for the directory scan.
+    """
+    entries = []
+    for entry in os.scandir(PDF_CACHE_DIR):
+        # Skip other compiles' in-progress temp files
+        if not entry.name.endswith('.pdf'):
+            continue
+        try:
+            entries.append((entry.stat().st_mtime_ns, entry.path))
+        except FileNotFoundError:
+            continue
+    if len(entries) <= PDF_CACHE_MAX_ENTRIES:
+        return
+    entries.sort()
+    for _, path in entries[:-PDF_CACHE_MAX_ENTRIES]:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+def fast_copy(source: Path, dest: Path) -> None:
+    """
+    Copy a file like shutil.copy2, using copy_file_range where available
+    
+    On Linux this lets the kernel copy (or reflink, on CoW filesystems like
+    Btrfs/XFS) without bouncing the data through user space.
+    """
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(source, 'rb') as src, open(dest, 'wb') as dst:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                shutil.copystat(source, dest)
+                return
+        except OSError:
+            pass
+    shutil.copy2(source, dest)
+
+# Resume sources copied by backup_resume_files
+FILES_TO_BACKUP = (
+    'Resume/Conner_Jordan_Software_Engineer.tex',
+    'Resume/Conner_Jordan_Software_Engineer.pdf',
+    'skills.tex',
+)
+
 def backup_resume_files(backup_dir: str) -> bool:
     """
     Create backup of current resume files before modification
@@ -83,18 +189,11 @@ def backup_resume_files(backup_dir: str) -> bool:
         backup_path = Path(backup_dir)
         backup_path.mkdir(parents=True, exist_ok=True)
         
-        # Files to backup
-        files_to_backup = [
-            'Resume/Conner_Jordan_Software_Engineer.tex',
-            'Resume/Conner_Jordan_Software_Engineer.pdf',
-            'skills.tex'
-        ]
-        
-        for file_path in files_to_backup:
+        for file_path in FILES_TO_BACKUP:
             source = Path(file_path)
             if source.exists():
                 dest = backup_path / source.name
-                shutil.copy2(source, dest)
+                fast_copy(source, dest)
                 print(f"✅ Backed up: {source} -> {dest}")
             else:
                 print(f"⚠️  File not found for backup: {source}")
@@ -136,26 +235,6 @@ def generate_comparison_pdfs(temp_dir: str) -> Tuple[Optional[str], Optional[str
     
     return before_pdf, after_pdf
 
-def pdf_to_base64(pdf_path: str) -> Optional[str]:
-    """
-    Convert PDF to base64 string for web display
-    
-    Args:
-        pdf_path: Path to PDF file
-    
-    Returns:
-        Base64 encoded PDF data, or None if failed
-    """
-    try:
-        import base64
-        with open(pdf_path, 'rb') as f:
-            pdf_data = f.read()
-            b64_data = base64.b64encode(pdf_data).decode('utf-8')
-            return b64_data
-    except Exception as e:
-        print(f"❌ Failed to encode PDF to base64: {e}")
-        return None
-
 if __name__ == "__main__":
     # Test PDF compilation
     test_tex = "Resume/Conner_Jordan_Software_Engineer.tex"
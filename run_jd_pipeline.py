@@ -10,11 +10,16 @@ Usage:
 """
 
 import argparse
+import os
+import signal
 import subprocess
 import sys
 import time
 from pathlib import Path
 
+# Per-step limit, matching the web UI's 30-minute LLM timeout
+STEP_TIMEOUT_S = 1800
+
 
 def run_command(cmd, description):
     """Run a command and return success status"""
@@ -25,17 +30,36 @@ def run_command(cmd, description):
     print()
 
     start_time = time.time()
+    # Own session/process group, so a timeout can kill the step and anything
+    # it spawned; output is inherited, so it streams straight to the terminal
+    proc = subprocess.Popen(cmd, start_new_session=True)
     try:
-        result = subprocess.run(
-            cmd, check=True, capture_output=False, text=True)
-        elapsed = time.time() - start_time
+        returncode = proc.wait(timeout=STEP_TIMEOUT_S)
+    except subprocess.TimeoutExpired:
+        kill_process_group(proc)
+        print(f"\n❌ {description} timed out after {STEP_TIMEOUT_S}s")
+        return False
+    except KeyboardInterrupt:
+        # Ctrl+C no longer reaches the child's process group directly
+        kill_process_group(proc)
+        raise
+
+    elapsed = time.time() - start_time
+    if returncode == 0:
         print(f"\n✅ {description} completed successfully ({elapsed:.1f}s)")
         return True
-    except subprocess.CalledProcessError as e:
-        elapsed = time.time() - start_time
-        print(f"\n❌ {description} failed after {elapsed:.1f}s")
-        print(f"Exit code: {e.returncode}")
-        return False
+    print(f"\n❌ {description} failed after {elapsed:.1f}s")
+    print(f"Exit code: {returncode}")
+    return False
+
+
+def kill_process_group(proc):
+    """SIGKILL a step started with start_new_session=True and its children"""
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+    proc.wait()
 
 
 def main():
@@ -15,11 +15,13 @@ Use --artifacts-only for testing the flow before updating your actual resume.
 
 import argparse
 import json
+import os
 import random
 import re
 import sys
 from pathlib import Path
 from typing import Dict, Any, List
+import orjson
 import requests
 
 # -------------------
@@ -30,6 +32,10 @@ DEFAULT_API_KEY = "lm-studio"
 DEFAULT_MODEL = "qwen2.5-32b-instruct"
 TIMEOUT_S = 1800  # 30 minutes
 
+# Kept open for the life of the process so repeated runs (e.g. from the web
+# UI) reuse the keep-alive connection to LM Studio instead of reconnecting
+HTTP_SESSION = requests.Session()
+
 EDITOR_OPTIONS = {
     "temperature": 0.0,
     "top_p": 0.9,
@@ -101,7 +107,7 @@ def chat_completions(base_url: str, api_key: str, model: str,
     if "stop" in options:
         payload["stop"] = options["stop"]
 
-    r = requests.post(url, headers={"Authorization": f"Bearer {api_key}"},
+    r = HTTP_SESSION.post(url, headers={"Authorization": f"Bearer {api_key}"},
                       json=payload, timeout=TIMEOUT_S)
     r.raise_for_status()
     data = r.json()
@@ -170,31 +176,43 @@ def build_job_skills_list(extractor_output: Dict[str, Any]) -> str:
     return "; ".join(flat)
 
 
+def section_header_patterns(section: str):
+    """Compile the \\textbf{<section>:} header pattern(s) for a required section"""
+    # Escape LaTeX special characters for regex
+    escaped_section = re.escape(section.replace("&", "\\&"))
+    # Make the pattern flexible to handle both single and double backslashes
+    pattern = re.compile(rf"\\+textbf\{{{escaped_section}:\}}")
+    # Also try a more flexible pattern for sections with ampersands
+    alt_pattern = None
+    if "&" in section:
+        # For sections like "Cloud & DevOps", also try without escaping
+        escaped_amp = section.replace('&', '\\&')
+        alt_pattern = re.compile(rf"\\+textbf\{{{escaped_amp}:\}}")
+    return pattern, alt_pattern
+
+
+REQUIRED_SECTIONS = (
+    "Programming Languages",
+    "Frontend",
+    "Backend",
+    "Cloud & DevOps",
+    "AI & LLM Tools",
+    "Automation & Productivity",
+    "Security & Operating Systems",
+    "Databases",
+)
+# (section, pattern, alt_pattern) built once instead of on every validation
+REQUIRED_SECTION_PATTERNS = tuple(
+    (section, *section_header_patterns(section)) for section in REQUIRED_SECTIONS
+)
+
+
 def validate_updated_block(updated: str) -> bool:
     """Validate that the updated block has all required sections"""
-    required_sections = [
-        "Programming Languages",
-        "Frontend",
-        "Backend",
-        "Cloud & DevOps",
-        "AI & LLM Tools",
-        "Automation & Productivity",
-        "Security & Operating Systems",
-        "Databases"
-    ]
-
-    for section in required_sections:
-        # Escape LaTeX special characters for regex
-        escaped_section = re.escape(section.replace("&", "\\&"))
-        # Make the pattern flexible to handle both single and double backslashes
-        pattern = rf"\\+textbf\{{{escaped_section}:\}}"
-        # Also try a more flexible pattern for sections with ampersands
-        if "&" in section:
-            # For sections like "Cloud & DevOps", also try without escaping
-            alt_pattern = rf"\\+textbf\{{{section.replace('&', '\\&')}:\}}"
-            if re.search(alt_pattern, updated):
-                continue
-        if not re.search(pattern, updated):
+    for section, pattern, alt_pattern in REQUIRED_SECTION_PATTERNS:
+        if alt_pattern is not None and alt_pattern.search(updated):
+            continue
+        if not pattern.search(updated):
             print(f"❌ Missing section: {section}")
             return False
 
@@ -225,7 +243,8 @@ def shuffle_skills_in_block(block_text: str) -> str:
     return '\n'.join(new_lines)
 
 
-def update_resume_tex(resume_path: Path, updated_skills: str) -> str:
+def update_resume_tex(resume_path: Path, updated_skills: str,
+                      artifacts_dir: Path = Path("artifacts")) -> str:
     """Update the resume .tex file with new skills section"""
     content = resume_path.read_text(encoding="utf-8")
 
@@ -261,7 +280,7 @@ def update_resume_tex(resume_path: Path, updated_skills: str) -> str:
         raise ValueError("Could not find closing brace for skills section")
 
     # Simply read the content from the artifacts file and paste it directly
-    artifacts_file = Path("artifacts/skills_updated_block.tex")
+    artifacts_file = artifacts_dir / "skills_updated_block.tex"
     if artifacts_file.exists():
         skills_content = artifacts_file.read_text(encoding="utf-8").strip()
     else:
@@ -357,31 +376,22 @@ def ensure_proper_spacing(updated_block: str) -> str:
 # -------------------
 
 
-def main():
-    ap = argparse.ArgumentParser(
-        description="Update resume skills section based on JD parser output")
-    ap.add_argument("--extractor-output", default="artifacts/jd_skills.json",
-                    help="Path to jd-parser.py output JSON file")
-    ap.add_argument("--skills", default="skills.tex",
-                    help="Path to current skills.tex file")
-    ap.add_argument("--resume", default="Resume/Conner_Jordan_Software_Engineer.tex",
-                    help="Path to main resume .tex file to update")
-    ap.add_argument("--base-url", default=DEFAULT_BASE_URL,
-                    help="LM Studio base URL")
-    ap.add_argument("--api-key", default=DEFAULT_API_KEY,
-                    help="API key (LM Studio ignores content)")
-    ap.add_argument("--model", default=DEFAULT_MODEL,
-                    help="Model name for skills editor")
-    ap.add_argument("--dry-run", action="store_true",
-                    help="Show changes without writing any files")
-    ap.add_argument("--artifacts-only", action="store_true",
-                    help="Only write to artifacts directory, don't update actual resume files")
-    args = ap.parse_args()
+def run(extractor_output: str = "artifacts/jd_skills.json", skills: str = "skills.tex",
+        resume: str = "Resume/Conner_Jordan_Software_Engineer.tex",
+        base_url: str = DEFAULT_BASE_URL, api_key: str = DEFAULT_API_KEY,
+        model: str = DEFAULT_MODEL, dry_run: bool = False,
+        artifacts_only: bool = False, artifacts_dir: str = "artifacts") -> Dict[str, Any]:
+    """
+    Update the skills section from the extractor output.
 
+    Importable entry point used by the web UI; returns the editor JSON and
+    the final LaTeX block.
+    """
     # Load files
-    extractor_path = Path(args.extractor_output)
-    skills_path = Path(args.skills)
-    resume_path = Path(args.resume)
+    extractor_path = Path(extractor_output)
+    skills_path = Path(skills)
+    resume_path = Path(resume)
+    artifacts_dir = Path(artifacts_dir)
 
     if not extractor_path.exists():
         sys.exit(f"ERROR: Extractor output not found: {extractor_path}")
@@ -391,11 +401,11 @@ def main():
         sys.exit(f"ERROR: Resume file not found: {resume_path}")
 
     print("== Skills Updater - Phase 2 ==")
-    if args.artifacts_only:
+    if artifacts_only:
         print("🔍 RUNNING IN ARTIFACTS-ONLY MODE")
         print("   Resume files will NOT be updated")
-        print("   Check artifacts/ directory for generated content")
-    elif args.dry_run:
+        print(f"   Check {artifacts_dir}/ directory for generated content")
+    elif dry_run:
         print("🔍 RUNNING IN DRY-RUN MODE")
         print("   No files will be written")
     else:
@@ -404,8 +414,7 @@ def main():
 
     # Load extractor output
     try:
-        with open(extractor_path, 'r', encoding='utf-8') as f:
-            extractor_output = json.load(f)
+        extractor_output = orjson.loads(extractor_path.read_bytes())
         print(f"✅ Loaded extractor output: {extractor_path}")
     except Exception as e:
         sys.exit(f"ERROR: Failed to load extractor output: {e}")
@@ -429,15 +438,15 @@ def main():
     )
 
     print(f"\n== Skills Editor (LaTeX update) ==")
-    print(f"Using model: {args.model}")
+    print(f"Using model: {model}")
     print(f"Timeout: {TIMEOUT_S} seconds")
 
     # Run skills editor
     try:
         editor_resp = chat_completions(
-            args.base_url,
-            args.api_key,
-            args.model,
+            base_url,
+            api_key,
+            model,
             [
                 {"role": "system", "content": SKILLS_EDITOR_SYSTEM},
                 {"role": "user", "content": editor_user_payload},
@@ -501,30 +510,31 @@ def main():
                 print(f"    Reason: {reason}")
 
     # Update files
-    if not args.dry_run:
+    if not dry_run:
         # Always save artifacts first
-        artifacts_dir = Path("artifacts")
-        artifacts_dir.mkdir(exist_ok=True)
+        artifacts_dir.mkdir(parents=True, exist_ok=True)
 
         # Save artifacts (these will overwrite existing files automatically)
-        (artifacts_dir / "skills_editor_output.json").write_text(
-            json.dumps(editor_json, ensure_ascii=False, indent=2), encoding="utf-8"
-        )
+        # JSON goes through a temp file + os.replace so readers never see it torn
+        editor_output_path = artifacts_dir / "skills_editor_output.json"
+        tmp_path = editor_output_path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(orjson.dumps(editor_json, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, editor_output_path)
         (artifacts_dir / "skills_updated_block.tex").write_text(updated_block, encoding="utf-8")
 
         print("\nWrote artifacts:")
-        print("  artifacts/skills_editor_output.json")
-        print("  artifacts/skills_updated_block.tex")
+        print(f"  {editor_output_path}")
+        print(f"  {artifacts_dir / 'skills_updated_block.tex'}")
 
         # Only update actual resume files if not in artifacts-only mode
-        if not args.artifacts_only:
+        if not artifacts_only:
             # Update skills.tex
             skills_path.write_text(updated_block, encoding="utf-8")
             print(f"\n✅ Updated: {skills_path}")
 
             # Update main resume .tex file
             try:
-                updated_resume = update_resume_tex(resume_path, updated_block)
+                updated_resume = update_resume_tex(resume_path, updated_block, artifacts_dir)
                 resume_path.write_text(updated_resume, encoding="utf-8")
                 print(f"✅ Updated: {resume_path}")
             except Exception as e:
@@ -532,12 +542,40 @@ def main():
                 print("   Skills section updated in skills.tex only")
         else:
             print("\n🔍 ARTIFACTS-ONLY MODE - Resume files not updated")
-            print("   Review artifacts/ directory for generated content")
+            print(f"   Review {artifacts_dir}/ directory for generated content")
     else:
         print("\n🔍 DRY RUN - No files were modified")
 
     print("\n🎉 Skills updater completed successfully!")
 
+    return {"editor_output": editor_json, "updated_block": updated_block}
+
+
+def main():
+    ap = argparse.ArgumentParser(
+        description="Update resume skills section based on JD parser output")
+    ap.add_argument("--extractor-output", default="artifacts/jd_skills.json",
+                    help="Path to jd-parser.py output JSON file")
+    ap.add_argument("--skills", default="skills.tex",
+                    help="Path to current skills.tex file")
+    ap.add_argument("--resume", default="Resume/Conner_Jordan_Software_Engineer.tex",
+                    help="Path to main resume .tex file to update")
+    ap.add_argument("--base-url", default=DEFAULT_BASE_URL,
+                    help="LM Studio base URL")
+    ap.add_argument("--api-key", default=DEFAULT_API_KEY,
+                    help="API key (LM Studio ignores content)")
+    ap.add_argument("--model", default=DEFAULT_MODEL,
+                    help="Model name for skills editor")
+    ap.add_argument("--dry-run", action="store_true",
+                    help="Show changes without writing any files")
+    ap.add_argument("--artifacts-only", action="store_true",
+                    help="Only write to artifacts directory, don't update actual resume files")
+    ap.add_argument("--artifacts-dir", default="artifacts",
+                    help="Directory to write editor artifacts into")
+    args = ap.parse_args()
+
+    run(**vars(args))
+
 
 if __name__ == "__main__":
     main()
@@ -9,13 +9,24 @@ original tone and professionalism.
 """
 
 import argparse
-import json
 import os
 import re
 import sys
 from pathlib import Path
+import orjson
 import requests
 
+SUMMARY_PATTERN = re.compile(
+    r"(% SUMMARY_BLOCK_START\n)(.*?)(\n% SUMMARY_BLOCK_END)", re.DOTALL
+)
+# Reused across runs so the web UI keeps its keep-alive connection to LM Studio
+HTTP_SESSION = requests.Session()
+
+# Markers the LLM is asked to wrap its answer in, so chatter around it is dropped
+SUMMARY_SENTINEL = re.compile(
+    r"=== SUMMARY_BEGIN ===\s*\n(.*?)\n\s*=== SUMMARY_END ===", re.DOTALL
+)
+
 
 def get_api_key(api_key):
     if api_key == "lm-studio":
@@ -51,7 +62,7 @@ def get_llm_response(base_url, api_key, model, prompt):
             "stop": []
         }
         
-        response = requests.post(
+        response = HTTP_SESSION.post(
             url, 
             headers={"Authorization": f"Bearer {api_key}"}, 
             json=payload, 
@@ -68,63 +79,35 @@ def update_tex_file(tex_content, new_block_content):
     # Remove the \n at the start of the block
     new_block_content = new_block_content.strip()
 
-    pattern = re.compile(
-        r"(% SUMMARY_BLOCK_START\n)(.*?)(\n% SUMMARY_BLOCK_END)", re.DOTALL
-    )
-    if not pattern.search(tex_content):
+    if not SUMMARY_PATTERN.search(tex_content):
         sys.exit("❌ ERROR: Could not find SUMMARY_BLOCK_START/END in tex file")
 
-    return pattern.sub(f"\1{new_block_content}\3", tex_content)
-
-
-def main():
-    ap = argparse.ArgumentParser(
-        description="Update summary in a tex file based on JD"
+    # Function replacement so backslashes in the LaTeX aren't read as group refs
+    return SUMMARY_PATTERN.sub(
+        lambda m: m.group(1) + new_block_content + m.group(3), tex_content
     )
-    ap.add_argument(
-        "--jd-skills",
-        default="artifacts/jd_skills.json",
-        help="Path to job description skills file",
-    )
-    ap.add_argument(
-        "--resume-file",
-        default="Resume/Conner_Jordan_Software_Engineer.tex",
-        help="Path to the resume tex file",
-    )
-    ap.add_argument(
-        "--base-url", default="http://127.0.0.1:1234/v1", help="LM Studio base URL"
-    )
-    ap.add_argument("--api-key", default="lm-studio", help="API key for LM Studio")
-    ap.add_argument(
-        "--model", default="qwen2.5-32b-instruct", help="Model name for the LLM"
-    )
-    ap.add_argument(
-        "--dry-run", action="store_true", help="Show changes without writing any files"
-    )
-    ap.add_argument(
-        "--artifacts-only",
-        action="store_true",
-        help="Only write to artifacts directory",
-    )
-    args = ap.parse_args()
 
-    # Setup
-    jd_skills_path = Path(args.jd_skills)
-    resume_file_path = Path(args.resume_file)
-    artifacts_dir = Path("artifacts")
-    artifacts_dir.mkdir(exist_ok=True)
+
+def run(jd_skills="artifacts/jd_skills.json",
+        resume_file="Resume/Conner_Jordan_Software_Engineer.tex",
+        base_url="http://127.0.0.1:1234/v1", api_key="lm-studio",
+        model="qwen2.5-32b-instruct", dry_run=False, artifacts_only=False,
+        artifacts_dir="artifacts"):
+    """Revise the summary block; importable entry point used by the web UI."""
+    jd_skills_path = Path(jd_skills)
+    resume_file_path = Path(resume_file)
+    artifacts_dir = Path(artifacts_dir)
+    artifacts_dir.mkdir(parents=True, exist_ok=True)
 
     # Read files
     jd_skills_content = read_file_content(jd_skills_path)
     resume_content = read_file_content(resume_file_path)
 
     # Extract original summary
-    original_summary_match = re.search(
-        r"% SUMMARY_BLOCK_START\n(.*)\n% SUMMARY_BLOCK_END", resume_content, re.DOTALL
-    )
+    original_summary_match = SUMMARY_PATTERN.search(resume_content)
     if not original_summary_match:
         sys.exit("❌ ERROR: Could not find summary block in resume file")
-    original_summary = original_summary_match.group(1).strip()
+    original_summary = original_summary_match.group(2).strip()
 
     # Create prompt
     prompt = f"""
@@ -145,37 +128,46 @@ def main():
     - Maintain a professional and confident tone.
     - The revised summary should be a natural evolution of the original, not a complete rewrite.
     - Make the changes subtle, so it's not obvious it was tailored.
-    - Output ONLY the revised summary text, without any preamble or explanation.
+    - Output ONLY the revised summary text, without any preamble or explanation,
+      wrapped exactly as:
+    === SUMMARY_BEGIN ===
+    <revised summary>
+    === SUMMARY_END ===
     """
 
     # Get LLM response
     print("🧠 Calling LLM to revise professional summary...")
-    revised_summary = get_llm_response(args.base_url, get_api_key(args.api_key), args.model, prompt)
+    llm_output = get_llm_response(base_url, get_api_key(api_key), model, prompt)
+    sentinel_match = SUMMARY_SENTINEL.search(llm_output)
+    revised_summary = (sentinel_match.group(1) if sentinel_match else llm_output).strip()
     print("✅ LLM response received.")
 
-    # Save artifacts
-    write_file_content(
-        artifacts_dir / "summary_editor_output.json",
-        json.dumps(
+    # Save artifacts; JSON goes through a temp file + os.replace so readers
+    # never see it torn
+    editor_output_path = artifacts_dir / "summary_editor_output.json"
+    tmp_path = editor_output_path.with_suffix(".json.tmp")
+    tmp_path.write_bytes(
+        orjson.dumps(
             {
                 "original_summary": original_summary,
                 "revised_summary": revised_summary,
                 "prompt": prompt,
             },
-            indent=2,
-        ),
+            option=orjson.OPT_INDENT_2,
+        )
     )
+    os.replace(tmp_path, editor_output_path)
     write_file_content(
         artifacts_dir / "summary_updated_block.tex", revised_summary
     )
 
-    if args.dry_run:
+    if dry_run:
         print("DRY RUN: Changes are not being saved.")
         print("--- ORIGINAL SUMMARY ---")
         print(original_summary)
         print("--- REVISED SUMMARY ---")
         print(revised_summary)
-    elif args.artifacts_only:
+    elif artifacts_only:
         print("ARTIFACTS ONLY: Resume file not modified.")
         print(f"✅ Revised summary saved to {artifacts_dir}")
     else:
@@ -184,6 +176,47 @@ def main():
         write_file_content(resume_file_path, updated_resume_content)
         print(f"✅ Resume file updated: {resume_file_path}")
 
+    return {"original_summary": original_summary, "revised_summary": revised_summary}
+
+
+def main():
+    ap = argparse.ArgumentParser(
+        description="Update summary in a tex file based on JD"
+    )
+    ap.add_argument(
+        "--jd-skills",
+        default="artifacts/jd_skills.json",
+        help="Path to job description skills file",
+    )
+    ap.add_argument(
+        "--resume-file",
+        default="Resume/Conner_Jordan_Software_Engineer.tex",
+        help="Path to the resume tex file",
+    )
+    ap.add_argument(
+        "--base-url", default="http://127.0.0.1:1234/v1", help="LM Studio base URL"
+    )
+    ap.add_argument("--api-key", default="lm-studio", help="API key for LM Studio")
+    ap.add_argument(
+        "--model", default="qwen2.5-32b-instruct", help="Model name for the LLM"
+    )
+    ap.add_argument(
+        "--dry-run", action="store_true", help="Show changes without writing any files"
+    )
+    ap.add_argument(
+        "--artifacts-only",
+        action="store_true",
+        help="Only write to artifacts directory",
+    )
+    ap.add_argument(
+        "--artifacts-dir",
+        default="artifacts",
+        help="Directory to write summary artifacts into",
+    )
+    args = ap.parse_args()
+
+    run(**vars(args))
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Tests for run_jd_parsing's in-flight dedupe: identical JDs submitted together
+share one extraction (see inflight_extractions in app.py)
+
+Run with: python3 -m unittest test_inflight_extraction
+"""
+
+import logging
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import app
+
+JD_TEXT = "We need Rust and Go."
+SKILLS = {
+    "job_skills_ranked": [{"canonical": "Rust", "section": "Programming Languages"}],
+    "by_section_top3": {"Programming Languages": ["Rust"]},
+    "skills_flat": ["Rust"],
+}
+
+
+class WaiterSeen(logging.Handler):
+    """Sets `event` once a request logs that it is waiting on another's extraction"""
+
+    def __init__(self, event: threading.Event):
+        super().__init__()
+        self.event = event
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if "Waiting for the same job description" in record.getMessage():
+            self.event.set()
+
+
+class InflightExtractionTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dirs = [tempfile.mkdtemp(), tempfile.mkdtemp()]
+        self.parser_started = threading.Event()
+        self.release_parser = threading.Event()
+        self.parser_calls = 0
+
+        # Always miss the JD cache so the request goes to the parser
+        patches = [
+            mock.patch.object(app.jd_cache, 'lookup', return_value=(None, (b'digest', None))),
+            mock.patch.object(app.jd_cache, 'store'),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        waiter_seen = threading.Event()
+        handler = WaiterSeen(waiter_seen)
+        app.logger.addHandler(handler)
+        self.addCleanup(app.logger.removeHandler, handler)
+        self.waiter_seen = waiter_seen
+
+    def tearDown(self):
+        for temp_dir in self.temp_dirs:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def blocking_parser(self, outcome):
+        """Fake jd_parser.run that blocks until released, then returns or raises `outcome`"""
+        def run(jd_text, artifacts_dir):
+            self.parser_calls += 1
+            self.parser_started.set()
+            self.release_parser.wait(timeout=10)
+            if isinstance(outcome, BaseException):
+                raise outcome
+            return outcome
+        return run
+
+    def run_two_identical(self, outcome):
+        """Submit the same JD twice, the second while the first is extracting"""
+        results = [None, None]
+
+        def submit(i):
+            results[i] = app.run_jd_parsing(JD_TEXT, self.temp_dirs[i])
+
+        with mock.patch.object(app.jd_parser, 'run', self.blocking_parser(outcome)):
+            owner = threading.Thread(target=submit, args=(0,))
+            owner.start()
+            self.assertTrue(self.parser_started.wait(timeout=10))
+
+            waiter = threading.Thread(target=submit, args=(1,))
+            waiter.start()
+            # Only let the owner finish once the waiter is blocked on its future
+            self.assertTrue(self.waiter_seen.wait(timeout=10))
+            self.release_parser.set()
+
+            owner.join(timeout=10)
+            waiter.join(timeout=10)
+        return results
+
+    def test_identical_jds_share_one_extraction(self):
+        owner_result, waiter_result = self.run_two_identical(SKILLS)
+
+        self.assertEqual(self.parser_calls, 1)
+        self.assertTrue(owner_result['success'])
+        self.assertTrue(waiter_result['success'])
+        self.assertEqual(waiter_result['skills_data'], SKILLS)
+        # The waiter gets its own copy of the artifact in its session dir
+        self.assertTrue((app.session_artifacts_dir(self.temp_dirs[1]) / 'jd_skills.json').exists())
+        self.assertEqual(app.inflight_extractions, {})
+
+    def test_owner_failure_reaches_waiter(self):
+        owner_result, waiter_result = self.run_two_identical(RuntimeError("LLM unreachable"))
+
+        self.assertEqual(self.parser_calls, 1)
+        for result in (owner_result, waiter_result):
+            self.assertFalse(result['success'])
+            self.assertIn("LLM unreachable", result['error'])
+        self.assertEqual(app.inflight_extractions, {})
+
+    def test_parser_exit_reaches_waiter(self):
+        owner_result, waiter_result = self.run_two_identical(SystemExit("bad reply"))
+
+        for result in (owner_result, waiter_result):
+            self.assertFalse(result['success'])
+            self.assertIn("bad reply", result['error'])
+        self.assertEqual(app.inflight_extractions, {})
+
+
+if __name__ == '__main__':
+    unittest.main()